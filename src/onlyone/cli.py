@@ -47,7 +47,7 @@ from onlyone.aliases import (
 from onlyone.progress_bar import ProgressBar
 from onlyone import __version__
 from onlyone.reporter import (
-    format_groups_output,
+    iter_groups_output,
     format_deletion_preview,
     format_deletion_result
 )
@@ -378,13 +378,14 @@ class CLIApplication:
             print("No duplicate groups found.")
             return
 
-        output = format_groups_output(
+        # Printed line by line: no single string holding the whole report
+        for line in iter_groups_output(
             groups,
             show_fav_marker=show_fav,
             ascii_only=ascii_only,
             stats=stats
-        )
-        print(output)
+        ):
+            print(line)
 
     def execute_keep_one(
             self,
@@ -8,6 +8,7 @@ This module provides functions to handle file size conversions,
 making it easier to display storage information in UIs, logs, or APIs.
 """
 
+from functools import lru_cache
 from typing import Union
 
 # Define conversion constants globally for performance.
@@ -21,6 +22,12 @@ _UNITS = {
     'B': 1,
 }
 
+# Unit suffixes sorted by length (descending) so 'KB' is matched before 'K'.
+_UNIT_SUFFIXES = tuple(sorted(_UNITS.keys(), key=len, reverse=True))
+
+# Units used by bytes_to_human, smallest first.
+_HUMAN_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
 def bytes_to_human(size_bytes: Union[int, float], precision: int = 2) -> str:
     """
     Convert bytes to a human-readable string representation.
@@ -52,10 +59,9 @@ def bytes_to_human(size_bytes: Union[int, float], precision: int = 2) -> str:
     if size_bytes == 0:
         return "0B"
 
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
     size = float(size_bytes)
 
-    for unit in units:
+    for unit in _HUMAN_UNITS:
         if size < 1024:
             # Format the number with specified precision
             formatted = f"{size:.{precision}f}{unit}"
@@ -72,12 +78,14 @@ def bytes_to_human(size_bytes: Union[int, float], precision: int = 2) -> str:
     # Fallback for extremely large sizes (Exabytes)
     return f"{size:.{precision}f}EB"
 
+@lru_cache(maxsize=128)
 def human_to_bytes(size_str: str) -> int:
     """
     Convert a human-readable size string back to bytes.
 
     Supports formats with or without spaces, case-insensitive.
     Examples: '1.5GB', '2048KB', '1000', '1K', '1M', '1G'.
+    Results are memoized: the GUI and CLI parse the same few size strings repeatedly.
 
     Args:
         size_str (str): The human-readable size string.
@@ -101,9 +109,8 @@ def human_to_bytes(size_str: str) -> int:
 
     size_str = size_str.strip().upper()
 
-    # Check for unit suffixes.
-    # Sort by length (descending) to ensure 'KB' is matched before 'K'.
-    for unit in sorted(_UNITS.keys(), key=len, reverse=True):
+    # Check for unit suffixes (longest first).
+    for unit in _UNIT_SUFFIXES:
         if size_str.endswith(unit):
             value_str = size_str[:-len(unit)].strip()
             try:
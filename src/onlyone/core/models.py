@@ -6,8 +6,8 @@ core/models.py
 Data models and domain logic for file scanning and deduplication.
 """
 import logging
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Union, Callable
+from dataclasses import dataclass, field, fields
+from typing import List, Dict, Optional, Union, Callable, Tuple
 import os
 from enum import Enum
 
@@ -101,6 +101,27 @@ class BoostMode(Enum):
 #  Core Data Models
 # ======================
 
+def _with_slots(cls):
+    """
+    Rebuilds a dataclass with __slots__ for its fields (dataclass(slots=True) needs Python 3.10).
+
+    Used for models created once per scanned file: no per-instance __dict__,
+    so less memory and faster attribute access.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # Defaults live in the generated __init__, class attributes would clash with the slots
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+@_with_slots
 @dataclass
 class FileHashes:
     full: Optional[bytes] = None
@@ -110,12 +131,13 @@ class FileHashes:
     phash: Optional[bytes] = None
 
     def __post_init__(self):
-        fields = getattr(self, '__dataclass_fields__', {})
-        for key in fields:
+        hash_fields = getattr(self, '__dataclass_fields__', {})
+        for key in hash_fields:
             value = getattr(self, key)
             if value is not None and not isinstance(value, bytes):
                 raise ValueError(f"Field '{key}' must be bytes or None")
 
+@_with_slots
 @dataclass
 class File:
     """
@@ -141,23 +163,29 @@ class File:
             _, ext = os.path.splitext(self.name)
             self.extension = ext.lower()  # ".JPG" → ".jpg"
 
+    @staticmethod
+    def favourite_dir_prefixes(favourite_dirs: List[str]) -> Tuple[str, ...]:
+        """
+        Normalizes favourite directories once, each with a trailing separator,
+        for use with set_favourite_status_by_prefixes() over many files.
+        """
+        return tuple(os.path.normpath(fav_dir) + os.sep for fav_dir in favourite_dirs)
+
     def set_favourite_status(self, favourite_dirs: List[str]) -> None:
         """
         Sets the is_from_fav_dir flag if the file is located in one of the favourite directories.
         The path is checked strictly: a file is considered to be from a favourite directory
         if its path starts with one of the paths from favourite_dirs.
         """
-        normalized_path = os.path.normpath(self.path)
-
-        for fav_dir in favourite_dirs:
-            normalized_fav_dir = os.path.normpath(fav_dir)
+        self.set_favourite_status_by_prefixes(File.favourite_dir_prefixes(favourite_dirs))
 
-            # Check if the file's path is a subpath of the favourite directory
-            if normalized_path.startswith(normalized_fav_dir + os.sep) or \
-                    normalized_path == normalized_fav_dir:
-                self.is_from_fav_dir = True
-                return
-        self.is_from_fav_dir = False
+    def set_favourite_status_by_prefixes(self, prefixes: Tuple[str, ...]) -> None:
+        """
+        Same as set_favourite_status(), with directories pre-normalized by favourite_dir_prefixes().
+        Appending a separator to the file path makes one startswith() cover both
+        "inside the directory" and "equal to the directory".
+        """
+        self.is_from_fav_dir = (os.path.normpath(self.path) + os.sep).startswith(prefixes)
 
     def __repr__(self):
         return f"<File path={self.path}, size={self.size}>"
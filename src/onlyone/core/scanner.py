@@ -52,11 +52,13 @@ class FileScanner:
         self.min_size = params.min_size_bytes
         self.max_size = params.max_size_bytes
         self.extensions = params.normalized_extensions
+        self._extension_set = frozenset(self.extensions)  # O(1) per-file lookup in _extension_passes
         self._exclude_mode = (params.extension_filter_mode == "blacklist")
 
         # Normalize favourite and excluded directories for consistent comparison
         self.favourite_dirs = [str(Path(d).resolve()) for d in params.favourite_dirs] if params.favourite_dirs else []
         self.excluded_dirs = [str(Path(d).resolve()) for d in params.excluded_dirs] if params.excluded_dirs else []
+        self._favourite_prefixes = File.favourite_dir_prefixes(self.favourite_dirs)
 
     def scan(
         self,
@@ -130,11 +132,21 @@ class FileScanner:
                         logger.debug("Scan interrupted by user")
                         return []
 
+                    root_path_obj = Path(root)
+
                     # Pre-filter subdirectories BEFORE os.walk enters them
-                    dirs[:] = [d for d in dirs if self._prefilter_dirs(Path(root) / d)]
+                    dirs[:] = [d for d in dirs if self._prefilter_dirs(root_path_obj / d)]
+
+                    # os.walk does not follow directory symlinks and symlinked files are skipped,
+                    # so a file's real path is its directory's real path plus its name.
+                    # Resolve once per directory instead of once per file.
+                    try:
+                        resolved_root = os.path.realpath(root)
+                    except (OSError, ValueError):
+                        resolved_root = None
 
                     for filename in files:
-                        path = Path(root) / filename
+                        path = root_path_obj / filename
                         # avoid symlinks BEFORE resolve
                         try:
                             if path.is_symlink():
@@ -144,12 +156,15 @@ class FileScanner:
                             continue
 
                         # Resolve absolute path to detect overlaps across different roots
-                        try:
-                            resolved_path = str(path.resolve())
-                        except (OSError, ValueError) as e:
-                            logger.warning(f"Could not resolve path (skipping): {path} | Error: {e}")
-                            stats["skipped_path_error"] += 1
-                            continue
+                        if resolved_root is not None:
+                            resolved_path = os.path.join(resolved_root, filename)
+                        else:
+                            try:
+                                resolved_path = str(path.resolve())
+                            except (OSError, ValueError) as e:
+                                logger.warning(f"Could not resolve path (skipping): {path} | Error: {e}")
+                                stats["skipped_path_error"] += 1
+                                continue
 
                         # Skip if already processed (overlap protection)
                         if resolved_path in seen_paths:
@@ -333,7 +348,7 @@ class FileScanner:
 
         if self.favourite_dirs:
             try:
-                file.set_favourite_status(self.favourite_dirs)
+                file.set_favourite_status_by_prefixes(self._favourite_prefixes)
             except Exception as e:
                 logger.debug(f"Error setting favourite status for {path}: {e}")
                 # Continue processing — favourite status is optional metadata
@@ -372,18 +387,18 @@ class FileScanner:
         Returns:
             bool: True if the file passes the extension filter, False otherwise.
         """
-        if not self.extensions:
+        if not self._extension_set:
             return True
 
         ext = path.suffix.lower()
 
         if self._exclude_mode:
             # Blacklist mode: accept file if its extension is NOT in the exclude list
-            if ext in self.extensions:
+            if ext in self._extension_set:
                 return False
             return True
         else:
             # Whitelist mode: accept file only if its extension IS in the allow list
-            if ext in self.extensions:
+            if ext in self._extension_set:
                 return True
             return False
\ No newline at end of file
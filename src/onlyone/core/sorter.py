@@ -29,17 +29,19 @@ class Sorter:
         if sort_order is None:
             sort_order = SortOrder.SHORTEST_PATH
 
+        # Build the key function once, not once per group
+        if sort_order == SortOrder.SHORTEST_FILENAME:
+            key_func = lambda f: (
+                not f.is_from_fav_dir,
+                len(f.name),
+                f.path_depth
+            )
+        else:
+            key_func = lambda f: (
+                not f.is_from_fav_dir,
+                f.path_depth,
+                len(f.name)
+            )
+
         for group in groups:
-            if sort_order == SortOrder.SHORTEST_FILENAME:
-                key_func = lambda f: (
-                    not f.is_from_fav_dir,
-                    len(f.name),
-                    f.path_depth
-                )
-            else:
-                key_func = lambda f: (
-                    not f.is_from_fav_dir,
-                    f.path_depth,
-                    len(f.name)
-                )
             group.files.sort(key=key_func)
\ No newline at end of file
@@ -6,6 +6,7 @@ Licensed under the MIT License
 core/stages.py
 Deduplication pipeline stages implementation for OnlyOne's multi-stage duplicate detection engine.
 """
+from bisect import bisect_left
 from typing import List, Dict, Optional, Callable
 from onlyone.core.models import File, DuplicateGroup, BoostMode
 from onlyone.core.grouper import FileGrouper
@@ -28,25 +29,32 @@ class HashStageBase:
 class DeduplicationConfig:
     EARLY_CONFIRMATION_SIZE_LIMIT = 128 * 1024  # Files ≤ this size can be confirmed after front hash
 
+    # Chunk size lookup for files above the early-confirmation limit:
+    # a file of size S gets _CHUNK_SIZES[i] where i is the first bound with S <= _CHUNK_SIZE_BOUNDS[i]
+    _CHUNK_SIZE_BOUNDS = (
+        EARLY_CONFIRMATION_SIZE_LIMIT * 2,
+        10 * 1024 * 1024,
+        30 * 1024 * 1024,
+        60 * 1024 * 1024,
+        120 * 1024 * 1024,
+        360 * 1024 * 1024,
+    )
+    _CHUNK_SIZES = (
+        EARLY_CONFIRMATION_SIZE_LIMIT,
+        64 * 1024,
+        128 * 1024,
+        256 * 1024,
+        512 * 1024,
+        1 * 1024 * 1024,
+        2 * 1024 * 1024,  # larger than the last bound
+    )
+
     @staticmethod
     def get_chunk_size(file_size: int) -> int:
-        limit = DeduplicationConfig.EARLY_CONFIRMATION_SIZE_LIMIT
-        if file_size <= limit:
+        if file_size <= DeduplicationConfig.EARLY_CONFIRMATION_SIZE_LIMIT:
             return file_size
-        elif file_size <= limit * 2:
-            return limit
-        elif file_size <= 10 * 1024 * 1024:
-            return 64 * 1024
-        elif file_size <= 30 * 1024 * 1024:
-            return 128 * 1024
-        elif file_size <= 60 * 1024 * 1024:
-            return 256 * 1024
-        elif file_size <= 120 * 1024 * 1024:
-            return 512 * 1024
-        elif file_size <= 360 * 1024 * 1024:
-            return 1 * 1024 * 1024
-        else:
-            return 2 * 1024 * 1024
+        index = bisect_left(DeduplicationConfig._CHUNK_SIZE_BOUNDS, file_size)
+        return DeduplicationConfig._CHUNK_SIZES[index]
 
 
 # =============================
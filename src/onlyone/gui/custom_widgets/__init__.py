@@ -1,15 +1,28 @@
 """
 Custom Qt widgets for the GUI layer.
+
+Widgets are imported on first access (e.g. ``custom_widgets.ImagePreviewLabel``),
+so importing one of them does not load the others.
 """
 
-from .duplicate_groups_list import DuplicateGroupsList
-from .favourite_dirs_dialog import FavouriteDirsDialog
-from .excluded_dirs_dialog import ExcludedDirsDialog
-from .image_preview_label import ImagePreviewLabel
+import importlib
+
+_WIDGET_MODULES = {
+    "DuplicateGroupsList": ".duplicate_groups_list",
+    "FavouriteDirsDialog": ".favourite_dirs_dialog",
+    "ExcludedDirsDialog": ".excluded_dirs_dialog",
+    "ImagePreviewLabel": ".image_preview_label",
+}
 
 __all__ = [
     "DuplicateGroupsList",
     "FavouriteDirsDialog",
     "ImagePreviewLabel",
     "ExcludedDirsDialog",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _WIDGET_MODULES:
+        return getattr(importlib.import_module(_WIDGET_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,33 +12,192 @@ and decoupled from business logic.
 """
 from __future__ import annotations
 import sys
-from PySide6.QtWidgets import QListWidget, QListWidgetItem, QMenu, QAbstractItemView, QWidget
-from PySide6.QtGui import QAction
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QListView, QMenu, QAbstractItemView, QWidget
+from PySide6.QtGui import QAction, QColor
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractListModel, QModelIndex, QItemSelectionModel, QSignalBlocker
+)
 from onlyone.core.models import File, DuplicateGroup
 from onlyone.services.file_service import FileService
 from onlyone.core.measurer import  bytes_to_human
 
+# Row kinds of the flattened group list
+_HEADER, _FILE, _SPACER = range(3)
 
-class DuplicateGroupsList(QListWidget):
+_KEEP_COLOR = QColor(Qt.GlobalColor.darkGreen)
+_DEL_COLOR = QColor(Qt.GlobalColor.darkRed)
+
+
+class DuplicateGroupsModel(QAbstractListModel):
+    """
+    Flat list model over duplicate groups: a header row, one row per file and
+    an empty spacer row for every group.
+
+    Rows are stored as compact (kind, value, number) tuples; text, tooltips and
+    colors are produced in data() only for the rows the view actually paints.
+    """
+    # Above this many separate row ranges to remove, a reset is cheaper
+    MAX_REMOVED_RANGES = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._text_cache = {}  # row -> display text, filled as rows are painted
+
+    def set_groups(self, groups: list[DuplicateGroup]):
+        """Rebuilds the row table from groups with a single model reset."""
+        self.beginResetModel()
+        self._rows = self._build_rows(groups)
+        self._text_cache.clear()
+        self.endResetModel()
+
+    def remove_files(self, file_paths, groups: list[DuplicateGroup]) -> bool:
+        """
+        Removes the rows of deleted files, and of groups left with fewer than two files,
+        without a model reset; the remaining rows are renumbered.
+
+        Groups are matched by content, so groups may be updated in place or rebuilt.
+        If the remaining rows do not line up with the rows of groups (the groups changed
+        beyond the deletion), the model is reset to groups instead.
+
+        Returns False (and changes nothing) if the removed rows are too scattered
+        for row removal to beat a rebuild; the caller should call set_groups() then.
+        """
+        ranges = []
+        drop_group = False
+        for row, (kind, value, _) in enumerate(self._rows):
+            if kind == _HEADER:
+                # Same rule as DuplicateService: a group needs two surviving files
+                drop_group = sum(1 for f in value.files if f.path not in file_paths) < 2
+            if drop_group or (kind == _FILE and value.path in file_paths):
+                if ranges and ranges[-1][1] == row - 1:
+                    ranges[-1][1] = row
+                else:
+                    ranges.append([row, row])
+
+        if len(ranges) > self.MAX_REMOVED_RANGES:
+            return False
+
+        # Row numbers and DEL numbers shift: cached texts are stale
+        self._text_cache.clear()
+        # Bottom-up, so earlier row numbers stay valid
+        for first, last in reversed(ranges):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+
+        # Renumber from groups; the remaining rows must be exactly the rows of groups
+        rows = self._build_rows(groups)
+        if self._layout(rows) != self._layout(self._rows):
+            self.set_groups(groups)
+            return True
+        self._rows = rows
+        if rows:
+            self.dataChanged.emit(self.index(0), self.index(len(rows) - 1))
+        return True
+
+    @staticmethod
+    def _layout(rows: list[tuple]) -> list[tuple]:
+        """Row kinds and file paths: what must match for two row tables to show the same files."""
+        return [(kind, value.path if kind == _FILE else None) for kind, value, _ in rows]
+
+    @staticmethod
+    def _build_rows(groups: list[DuplicateGroup]) -> list[tuple]:
+        """
+        Builds numbered rows in one pass: group numbers on header rows and
+        KEEP (0) / DEL #n numbers on file rows.
+
+        Files arrive favourite-first (Sorter / update_favourite_status_in_groups),
+        so the first file of a group is the one to keep.
+        """
+        rows = []
+        append = rows.append
+        # Global DEL file counter — does not reset between groups
+        del_counter = 1
+        for group_number, group in enumerate(groups, 1):
+            append((_HEADER, group, group_number))
+            files = group.files
+            if files:
+                append((_FILE, files[0], 0))
+                for file in files[1:]:
+                    append((_FILE, file, del_counter))
+                    del_counter += 1
+            # Empty line between groups
+            append((_SPACER, None, 0))
+        return rows
+
+    def rows_for_paths(self, paths) -> list[int]:
+        """Returns the row numbers of file rows whose path is in paths (a set)."""
+        return [
+            row for row, (kind, value, _) in enumerate(self._rows)
+            if kind == _FILE and value.path in paths
+        ]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def flags(self, index):
+        if index.isValid() and self._rows[index.row()][0] == _FILE:
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        return Qt.ItemFlag.NoItemFlags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            text = self._text_cache.get(row)
+            if text is None:
+                text = self._text_cache[row] = self._display_text(*self._rows[row])
+            return text
+
+        kind, value, number = self._rows[row]
+        if kind == _FILE:
+            if role == Qt.ItemDataRole.UserRole:
+                return value
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return f"Path: {value.path}"
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return _DEL_COLOR if number else _KEEP_COLOR
+        return None
+
+    @staticmethod
+    def _display_text(kind, value, number) -> str:
+        if kind == _FILE:
+            fav_marker = " ✅" if value.is_from_fav_dir else ""
+            status_marker = f" [DEL #{number}]" if number else " [KEEP]"
+            return f"     {value.name}{fav_marker}{status_marker}"
+        if kind == _HEADER:
+            return f"📁 Group {number} | Size: {bytes_to_human(value.size)}"
+        return ""
+
+
+class DuplicateGroupsList(QListView):
     """
-    A custom list widget that displays duplicate groups.
+    A custom list view that displays duplicate groups.
+
+    Backed by DuplicateGroupsModel, so only visible rows are materialized,
+    no matter how many files the groups contain.
 
     Signals:
         file_selected (File): Emitted when a file item is clicked.
         delete_requested (list[str]): Emitted when files should be deleted.
     """
     file_selected = Signal(File)
-    delete_requested = Signal(list)
+    delete_requested = Signal(object)
 
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
+        self.setModel(DuplicateGroupsModel(self))
+        # All rows are single text lines: let the view skip per-row size hints
+        self.setUniformItemSizes(True)
         self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
-        self.itemClicked.connect(self.on_item_clicked)
-        self.currentItemChanged.connect(self._on_current_item_changed)
+        self.clicked.connect(self.on_item_clicked)
+        self.selectionModel().currentChanged.connect(self._on_current_item_changed)
         self.current_groups = []
+        self._hidden_paths = set()  # see hide_files()
 
     def set_groups(self, groups: list[DuplicateGroup]):
         """Displays a list of duplicate groups in the UI."""
@@ -47,66 +206,70 @@ class DuplicateGroupsList(QListWidget):
 
     def _populate_list(self):
         """Internal method to populate the list with current groups"""
-        self.clear()
-
-        # Global DEL file counter — does not reset between groups
-        del_counter = 1
-
-        for idx, group in enumerate(self.current_groups):
-            # Sort: favorite directory files first (they will be "KEEP")
-            group.files.sort(key=lambda f: not f.is_from_fav_dir)
-            size_str = bytes_to_human(group.size)
-
-            # Group header
-            folder_title = f"📁 Group {idx + 1} | Size: {size_str}"
-            folder_title_item = QListWidgetItem(folder_title)
-            folder_title_item.setFlags(Qt.ItemFlag.NoItemFlags)
-            self.addItem(folder_title_item)
-
-            for file_idx, file in enumerate(group.files):
-                fav_marker = " ✅" if file.is_from_fav_dir else ""
+        self._hidden_paths = set()
+        # Suppress repaints until the new rows are in place
+        self.setUpdatesEnabled(False)
+        try:
+            # The reset drops current item and selection; nothing to report for that
+            with QSignalBlocker(self.selectionModel()):
+                self.model().set_groups(self.current_groups)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def hide_files(self, file_paths):
+        """
+        Hides the rows of the given files until the next repopulation or remove_files().
 
-                # First file = KEEP, others = DEL with global number
-                is_keep = (file_idx == 0)
+        Used for optimistic removal while files are moved to trash: any file that
+        could not be deleted is shown again afterwards.
+        """
+        paths = set(file_paths)
+        self._hidden_paths |= paths
+        for row in self.model().rows_for_paths(paths):
+            self.setRowHidden(row, True)
 
-                if is_keep:
-                    status_marker = " [KEEP]"
-                    foreground_color = Qt.GlobalColor.darkGreen
-                else:
-                    status_marker = f" [DEL #{del_counter}]"
-                    foreground_color = Qt.GlobalColor.darkRed
-                    del_counter += 1  # Increment global counter
+    def remove_files(self, file_paths, groups: list[DuplicateGroup]):
+        """
+        Updates the list after files were deleted, removing only the affected rows.
 
-                item_text = f"     {file.name}{fav_marker}{status_marker}"
-                tooltip_text = f"Path: {file.path}"
+        Unlike set_groups(), this keeps the scroll position and the selection of the
+        remaining rows. Falls back to a full rebuild if the removal is very scattered.
+        """
+        self.current_groups = groups
+        deleted = file_paths if isinstance(file_paths, (set, frozenset)) else set(file_paths)
+        if not self.model().remove_files(deleted, groups):
+            self._populate_list()
+            return
 
-                item = QListWidgetItem(item_text)
-                item.setToolTip(tooltip_text)
-                item.setData(Qt.ItemDataRole.UserRole, file)
-                item.setForeground(foreground_color)
-                self.addItem(item)
+        # Show again rows hidden by hide_files() whose file was not deleted
+        restored = self._hidden_paths - deleted
+        self._hidden_paths = set()
+        for row in self.model().rows_for_paths(restored):
+            self.setRowHidden(row, False)
 
-            # Empty line between groups
-            empty_item = QListWidgetItem("")
-            empty_item.setFlags(Qt.ItemFlag.NoItemFlags)
-            self.addItem(empty_item)
+    def _selected_file_indexes(self):
+        """Returns selected indexes that carry a File (group headers excluded)."""
+        return [
+            index for index in self.selectedIndexes()
+            if index.data(Qt.ItemDataRole.UserRole) is not None
+        ]
 
-    def on_item_clicked(self, item):
+    def on_item_clicked(self, index):
         """Emits signal when a file item is clicked."""
-        file = item.data(Qt.ItemDataRole.UserRole)
+        file = index.data(Qt.ItemDataRole.UserRole)
         if file:
             self.file_selected.emit(file)
 
     def _on_current_item_changed(self, current, _previous):
         """Handles current item changes (via mouse or keyboard)."""
-        if current:
+        if current.isValid():
             file = current.data(Qt.ItemDataRole.UserRole)
             if file:
                 self.file_selected.emit(file)
 
     def show_context_menu(self, point):
         """Shows context menu on right-click."""
-        selected_items = self.selectedItems()
+        selected_items = self._selected_file_indexes()
         if not selected_items:
             return
 
@@ -137,7 +300,7 @@ class DuplicateGroupsList(QListWidget):
 
     def delete_selected_files(self, selected_items):
         """Emits signal with file paths to be moved to trash."""
-        file_paths = [item.data(Qt.ItemDataRole.UserRole).path for item in selected_items]
+        file_paths = [index.data(Qt.ItemDataRole.UserRole).path for index in selected_items]
         self.delete_requested.emit(file_paths)
 
     def keyPressEvent(self, event):
@@ -151,11 +314,11 @@ class DuplicateGroupsList(QListWidget):
         # --- 1. Handle Ctrl+Space for toggling selection ---
         # This allows keyboard-only users to select/deselect items without mouse
         if event.key() == Qt.Key.Key_Space and event.modifiers() & Qt.KeyboardModifier.ControlModifier:
-            current = self.currentItem()
+            current = self.currentIndex()
             # Ensure we don't select header items (which have no UserRole data)
-            if current and current.data(Qt.ItemDataRole.UserRole) is not None:
+            if current.isValid() and current.data(Qt.ItemDataRole.UserRole) is not None:
                 # Toggle selection state
-                current.setSelected(not current.isSelected())
+                self.selectionModel().select(current, QItemSelectionModel.SelectionFlag.Toggle)
                 event.accept()
                 return
 
@@ -175,12 +338,8 @@ class DuplicateGroupsList(QListWidget):
             )
 
             if is_standard_delete or is_macos_cmd_backspace:
-                selected_items = self.selectedItems()
-                # Filter only items that contain file data (exclude group headers)
-                file_items = [
-                    item for item in selected_items
-                    if item.data(Qt.ItemDataRole.UserRole) is not None
-                ]
+                # Only items that contain file data (group headers excluded)
+                file_items = self._selected_file_indexes()
                 if file_items:
                     self.delete_selected_files(file_items)
                     event.accept()
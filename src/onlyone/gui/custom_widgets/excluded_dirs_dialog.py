@@ -17,15 +17,11 @@ class ExcludedDirsDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Excluded Folders")
         self.setMinimumWidth(500)
-        self.excluded_dirs = initial_dirs or []
 
+        self._dir_picker = None  # folder picker for on_add, created on first use
         self.list_widget = QListWidget(self)
         self.list_widget.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
 
-        if self.excluded_dirs:
-            for path in self.excluded_dirs:
-                self.list_widget.addItem(path)
-
         add_button = QPushButton("Add Folder", self)
         remove_button = QPushButton("Remove Selected", self)
         ok_button = QPushButton("OK", self)
@@ -47,13 +43,29 @@ class ExcludedDirsDialog(QDialog):
         ok_button.clicked.connect(self.accept)
         cancel_button.clicked.connect(self.reject)
 
+        self.set_dirs(initial_dirs or [])
+
+    def set_dirs(self, dirs: List[str]):
+        """Load the excluded folders to edit (the dialog is reused between openings)."""
+        self.excluded_dirs = list(dirs)
+        self.list_widget.clear()
+        self.list_widget.addItems(self.excluded_dirs)
+
     def get_selected_dirs(self) -> List[str]:
         """Returns the selected excluded folders."""
         return [self.list_widget.item(i).text() for i in range(self.list_widget.count())]
 
     def on_add(self):
         """Handler for adding a new folder."""
-        dir_path = QFileDialog.getExistingDirectory(self, "Select Folder to Exclude")
+        if self._dir_picker is None:
+            # Built once and reused across Add clicks and dialog openings
+            self._dir_picker = QFileDialog(self, "Select Folder to Exclude")
+            self._dir_picker.setFileMode(QFileDialog.FileMode.Directory)
+            self._dir_picker.setOption(QFileDialog.Option.ShowDirsOnly, True)
+        if self._dir_picker.exec() != QDialog.DialogCode.Accepted:
+            return
+        selected = self._dir_picker.selectedFiles()
+        dir_path = selected[0] if selected else ""
         if dir_path:
             if dir_path not in self.excluded_dirs:
                 self.excluded_dirs.append(dir_path)
@@ -35,16 +35,12 @@ class FavouriteDirsDialog(QDialog):
         self.setWindowTitle("Priority Folders")
         self.setMinimumWidth(500)
 
-        self.favourite_dirs = initial_dirs or []
+        self._dir_picker = None  # folder picker for on_add, created on first use
 
         # Folder list widget with explicit parent
         self.list_widget = QListWidget(self)
         self.list_widget.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
 
-        if self.favourite_dirs:
-            for path in self.favourite_dirs:
-                self.list_widget.addItem(path)
-
         # Buttons with explicit parent
         add_button = QPushButton("Add Folder", self)
         remove_button = QPushButton("Remove Selected", self)
@@ -68,13 +64,29 @@ class FavouriteDirsDialog(QDialog):
         ok_button.clicked.connect(self.accept)
         cancel_button.clicked.connect(self.reject)
 
+        self.set_dirs(initial_dirs or [])
+
+    def set_dirs(self, dirs: List[str]):
+        """Load the favourite folders to edit (the dialog is reused between openings)."""
+        self.favourite_dirs = list(dirs)
+        self.list_widget.clear()
+        self.list_widget.addItems(self.favourite_dirs)
+
     def get_selected_dirs(self) -> List[str]:
         """Returns the selected favourite folders."""
         return [self.list_widget.item(i).text() for i in range(self.list_widget.count())]
 
     def on_add(self):
         """Handler for adding a new folder."""
-        dir_path = QFileDialog.getExistingDirectory(self, "Select Priority Folder to add")
+        if self._dir_picker is None:
+            # Built once and reused across Add clicks and dialog openings
+            self._dir_picker = QFileDialog(self, "Select Priority Folder to add")
+            self._dir_picker.setFileMode(QFileDialog.FileMode.Directory)
+            self._dir_picker.setOption(QFileDialog.Option.ShowDirsOnly, True)
+        if self._dir_picker.exec() != QDialog.DialogCode.Accepted:
+            return
+        selected = self._dir_picker.selectedFiles()
+        dir_path = selected[0] if selected else ""
         if dir_path:
             if dir_path not in self.favourite_dirs:
                 self.favourite_dirs.append(dir_path)
@@ -0,0 +1,48 @@
+"""
+Copyright (c) 2025 initumX (initum.x@gmail.com)
+Licensed under the MIT License
+
+folder_list_model.py
+
+Read-only list model over folder paths, shown by the priority and excluded folder lists.
+"""
+from __future__ import annotations
+from typing import Iterable, List
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+
+class FolderListModel(QAbstractListModel):
+    """
+    Folder paths kept in a plain Python list; no item object per folder.
+
+    The full path is both the display text and the tooltip, so paths elided
+    by a narrow list can still be read. Rows are selectable but not editable.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._paths: List[str] = []
+
+    def set_paths(self, paths: Iterable[str]) -> None:
+        """Replaces all paths with a single model reset."""
+        self.beginResetModel()
+        self._paths = list(paths)
+        self.endResetModel()
+
+    def paths(self) -> List[str]:
+        return list(self._paths)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+
+    def flags(self, index):
+        if index.isValid():
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        return Qt.ItemFlag.NoItemFlags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return self._paths[index.row()]
+        return None
@@ -14,21 +14,75 @@ Implements a QLabel-based image viewer that:
 - Handles loading errors gracefully
 """
 
+from typing import Optional
 from PySide6.QtWidgets import QLabel, QSizePolicy
-from PySide6.QtCore import Qt, QRunnable, QThreadPool, QObject, Signal
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import Qt, QRunnable, QThreadPool, QObject, Signal, QSize, QTimer
+from PySide6.QtGui import QPixmap, QPixmapCache, QImageReader
 from onlyone.core.models import File
+from onlyone.gui.custom_widgets.preview_disk_cache import PreviewDiskCache
+
+
+# Shared by all ImagePreviewLabel instances, see _preview_pool()
+_pool = None
+
+
+def _preview_pool() -> QThreadPool:
+    """
+    Process-wide preview decode pool, created on first use.
+
+    One thread, so previews never compete with each other (or with more than one core of
+    the scan) and loads superseded while queued return without decoding.
+    The idle thread exits after a few seconds instead of the default 30.
+    """
+    global _pool
+    if _pool is None:
+        _pool = QThreadPool()
+        _pool.setMaxThreadCount(1)
+        _pool.setExpiryTimeout(5000)
+    return _pool
+
+
+class DiskCacheClearRunnable(QRunnable):
+    """Deletes all previews of a PreviewDiskCache in the preview pool."""
+
+    def __init__(self, disk_cache: PreviewDiskCache):
+        super().__init__()
+        self.disk_cache = disk_cache
+        self.setAutoDelete(True)
+
+    def run(self):
+        self.disk_cache.clear()
+
+
+def clear_disk_cache(disk_cache: PreviewDiskCache) -> None:
+    """
+    Clears the cache off the GUI thread.
+
+    Queued on the preview pool, so it runs after the loads already queued there
+    (and their cache writes) instead of racing them.
+    """
+    _preview_pool().start(DiskCacheClearRunnable(disk_cache))
 
 
 class ImageLoaderSignals(QObject):
-    image_loaded = Signal(object)
-    loading_failed = Signal(str)
+    image_loaded = Signal(object, str)  # QImage, file path
+    loading_failed = Signal(str, str)  # error message, file path
 
 
 class ImageLoaderRunnable(QRunnable):
-    def __init__(self, file_path):
+    """
+    Decodes an image in the thread pool.
+
+    When a target size is given, large images are decoded directly at that size
+    (QImageReader.setScaledSize), so JPEG/PNG decoders can downscale while reading
+    instead of materializing the full-resolution bitmap first.
+    Emits a QImage: unlike QPixmap, QImage is safe to create outside the GUI thread.
+    """
+    def __init__(self, file_path, target_size: QSize = None, disk_cache: Optional[PreviewDiskCache] = None):
         super().__init__()
         self.file_path = file_path
+        self.target_size = target_size
+        self.disk_cache = disk_cache
         self.signals = ImageLoaderSignals()
         self.is_running = True
 
@@ -36,54 +90,149 @@ class ImageLoaderRunnable(QRunnable):
         if not self.is_running:
             return
 
-        pixmap = QPixmap(self.file_path)
-        if pixmap.isNull():
-            self.signals.loading_failed.emit("Unsupported image format or corrupted file.")
+        target = self.target_size
+        has_target = target is not None and target.isValid()
+        use_disk_cache = self.disk_cache is not None and has_target
+        if use_disk_cache:
+            cached = self.disk_cache.load(self.file_path, target)
+            if cached is not None:
+                self.signals.image_loaded.emit(cached, self.file_path)
+                return
+
+        reader = QImageReader(self.file_path)
+        reader.setAutoTransform(True)
+
+        source_size = reader.size()
+        downscaled = False
+        if has_target and source_size.isValid() and self._exceeds(source_size, target):
+            reader.setScaledSize(source_size.scaled(target, Qt.AspectRatioMode.KeepAspectRatio))
+            downscaled = True
+
+        image = reader.read()
+        if not self.is_running:
+            return  # Superseded while decoding
+        if not image.isNull() and has_target and self._exceeds(image.size(), target):
+            # Size was unknown before decoding: downscale here rather than in the GUI thread
+            image = image.scaled(
+                target, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+            )
+            downscaled = True
+            if not self.is_running:
+                return  # Superseded while scaling
+
+        # Only downscaled images are worth caching; small ones decode as fast as they load
+        if use_disk_cache and downscaled and not image.isNull():
+            self.disk_cache.store(self.file_path, target, image)
+
+        if image.isNull():
+            self.signals.loading_failed.emit("Unsupported image format or corrupted file.", self.file_path)
         else:
-            self.signals.image_loaded.emit(pixmap)
+            self.signals.image_loaded.emit(image, self.file_path)
+
+    @staticmethod
+    def _exceeds(size: QSize, target: QSize) -> bool:
+        return size.width() > target.width() or size.height() > target.height()
 
     def cancel(self):
         self.is_running = False
 
+    @property
+    def cache_key(self) -> str:
+        """QPixmapCache key for the decoded result: path plus decode size."""
+        size = self.target_size or QSize()
+        return f"{self.file_path}|{size.width()}x{size.height()}"
+
 
 class ImagePreviewLabel(QLabel):
+    # Decoded previews kept in QPixmapCache, so going back to a file is instant
+    PIXMAP_CACHE_LIMIT_KB = 32 * 1024
+    # Decoding starts once the selection rests this long (e.g. holding an arrow key)
+    LOAD_DELAY_MS = 80
+    # While resizing, a fast scale is shown and the smooth one follows once resizing pauses
+    RESCALE_DELAY_MS = 40
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        if QPixmapCache.cacheLimit() < self.PIXMAP_CACHE_LIMIT_KB:
+            QPixmapCache.setCacheLimit(self.PIXMAP_CACHE_LIMIT_KB)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setText("Select an image or pdf file to preview...")
         self.setWordWrap(True)
         self.current_file = None
         self.original_pixmap = None
+        self._scaled_key = None  # (pixmap cacheKey, width, height) of the pixmap on display
         self.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
-        self.thread_pool = QThreadPool()
         self.current_runnable = None
+        self.disk_cache: Optional[PreviewDiskCache] = None  # set by the owner to enable
+        self._load_timer = QTimer(self)
+        self._load_timer.setSingleShot(True)
+        self._load_timer.setInterval(self.LOAD_DELAY_MS)
+        self._load_timer.timeout.connect(self._start_current_load)
+        self._rescale_timer = QTimer(self)
+        self._rescale_timer.setSingleShot(True)
+        self._rescale_timer.setInterval(self.RESCALE_DELAY_MS)
+        self._rescale_timer.timeout.connect(self.update_pixmap)
+
+    @property
+    def thread_pool(self) -> QThreadPool:
+        return _preview_pool()
 
     def set_file(self, file: File):
         self.current_file = file
         self.setText("Loading preview...")
+        self._scaled_key = None  # setText() dropped the displayed pixmap
 
         if self.current_runnable:
             self.current_runnable.cancel()
+            # A superseded load may still finish: its results are not delivered here at all
+            self.current_runnable.signals.disconnect(self)
             self.current_runnable = None
 
-        runnable = ImageLoaderRunnable(file.path)
+        runnable = ImageLoaderRunnable(file.path, self._decode_size(), self.disk_cache)
+        cached = QPixmapCache.find(runnable.cache_key)
+        if cached is not None:
+            self.original_pixmap = cached
+            self.update_pixmap()
+            return
+
         runnable.signals.image_loaded.connect(self._on_image_loaded)
         runnable.signals.loading_failed.connect(self._on_loading_failed)
         self.current_runnable = runnable
-        self.thread_pool.start(runnable)
+        self._load_timer.start()
 
-    def _on_image_loaded(self, pixmap):
+    def _start_current_load(self):
+        """Queues the decode of the file that was selected last."""
         if self.current_runnable:
-            self.original_pixmap = pixmap
+            self.thread_pool.start(self.current_runnable)
+
+    def _decode_size(self) -> QSize:
+        """Target decode size: the label's current size in device pixels."""
+        ratio = self.devicePixelRatioF()
+        return QSize(int(self.width() * ratio), int(self.height() * ratio))
+
+    def _is_current_load(self, file_path) -> bool:
+        """False for results of a load that was superseded by a newer set_file()."""
+        return self.current_runnable is not None and self.current_runnable.file_path == file_path
+
+    def _on_image_loaded(self, image, file_path):
+        runnable = self.current_runnable
+        if self._is_current_load(file_path):
+            self.original_pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(runnable.cache_key, self.original_pixmap)
             self.update_pixmap()
 
-    def _on_loading_failed(self, error_message):
+    def _on_loading_failed(self, error_message, file_path):
+        if not self._is_current_load(file_path):
+            return
         self.setText(error_message)
         self.original_pixmap = None
 
     def update_pixmap(self):
         if not self.original_pixmap:
             return
+        key = (self.original_pixmap.cacheKey(), self.width(), self.height())
+        if key == self._scaled_key:
+            return  # Same pixmap at the same size is already on display
 
         scaled = self.original_pixmap.scaled(
             self.size(),
@@ -91,7 +240,16 @@ class ImagePreviewLabel(QLabel):
             Qt.TransformationMode.SmoothTransformation
         )
         self.setPixmap(scaled)
+        self._scaled_key = key
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self.update_pixmap()
\ No newline at end of file
+        if not self.original_pixmap:
+            return
+        self.setPixmap(self.original_pixmap.scaled(
+            self.size(),
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.FastTransformation
+        ))
+        self._scaled_key = None  # the smooth scale is still due
+        self._rescale_timer.start()
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Copyright (c) 2025 initumX (initum.x@gmail.com)
+Licensed under the MIT License
+
+preview_disk_cache.py
+
+Persistent on-disk cache of downscaled image previews.
+Kept free of widget imports, so the main window UI can read its location and
+size cap without loading the image preview.
+"""
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QImage
+
+
+class PreviewDiskCache:
+    """
+    On-disk cache of downscaled previews, kept between sessions.
+
+    Entries are keyed by file path, modification time, file size and decode size,
+    so an edited file or another preview size never hits a stale entry.
+    Used from the preview pool thread; each entry is written to a temporary file
+    and renamed into place, so a reader never sees a partial image.
+    Without a directory, entries go to ~/.onlyone/cache/previews.
+    """
+    MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, directory: Optional[Path] = None):
+        if directory is None:
+            directory = Path.home() / ".onlyone" / "cache" / "previews"
+        self.directory = Path(directory)
+        self._pruned = False
+
+    def _entry_path(self, file_path: str, target: QSize) -> Optional[Path]:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        key = f"{file_path}|{stat.st_mtime_ns}|{stat.st_size}|{target.width()}x{target.height()}"
+        return self.directory / hashlib.sha1(key.encode("utf-8", "surrogateescape")).hexdigest()
+
+    def load(self, file_path: str, target: QSize) -> Optional[QImage]:
+        entry = self._entry_path(file_path, target)
+        if entry is None or not entry.is_file():
+            return None
+        image = QImage(str(entry))
+        return None if image.isNull() else image
+
+    def store(self, file_path: str, target: QSize, image: QImage) -> None:
+        entry = self._entry_path(file_path, target)
+        if entry is None:
+            return
+        tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # JPEG keeps entries small; PNG only where transparency must survive
+            saved = (image.save(str(tmp), "PNG") if image.hasAlphaChannel()
+                     else image.save(str(tmp), "JPG", 90))
+            if saved:
+                os.replace(tmp, entry)
+            elif tmp.exists():
+                tmp.unlink()
+        except OSError:
+            return
+        if not self._pruned:
+            self._pruned = True
+            self._prune()
+
+    def clear(self) -> None:
+        """Deletes all cached previews; entries that cannot be removed are skipped."""
+        try:
+            entries = [e for e in self.directory.iterdir() if e.is_file()]
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+
+    def _prune(self) -> None:
+        """Deletes the least recently written entries while the cache exceeds MAX_BYTES."""
+        try:
+            entries = [(e.stat().st_mtime, e.stat().st_size, e) for e in self.directory.iterdir() if e.is_file()]
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.MAX_BYTES:
+                break
+            try:
+                entry.unlink()
+                total -= size
+            except OSError:
+                pass
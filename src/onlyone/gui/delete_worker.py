@@ -0,0 +1,85 @@
+"""
+Qt worker runnable that moves files to trash in the thread pool.
+Keeps the GUI thread free (no processEvents loop) while files are being deleted.
+"""
+from typing import Dict, List, Optional
+from PySide6.QtCore import QRunnable, QObject, Signal, QMutex, QMutexLocker, QElapsedTimer
+from onlyone.services.file_service import FileService
+from onlyone.core.measurer import bytes_to_human
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class DeleteWorkerSignals(QObject):
+    """
+    Signals for DeleteWorker.
+    Path lists are declared as object: they reach the slot as the same Python list,
+    without being converted to a QVariantList and back into new strings.
+    """
+    progress = Signal(int, str)              # deleted_count, last deleted path
+    finished = Signal(object, object, bool)  # deleted paths, failed (path, error) tuples, was_stopped
+
+
+class DeleteWorker(QRunnable):
+    """
+    Worker that moves files to trash in a background thread.
+
+    Progress is emitted at most every PROGRESS_INTERVAL_MS, so the number of
+    cross-thread signals does not grow with the number of files.
+    `finished` is always emitted, also after stop(), with the files deleted so far.
+    """
+    PROGRESS_INTERVAL_MS = 50
+
+    def __init__(self, file_paths: List[str], file_sizes: Optional[Dict[str, int]] = None):
+        super().__init__()
+        self.file_paths = list(file_paths)
+        self.file_sizes = file_sizes or {}
+        self.signals = DeleteWorkerSignals()
+        self._stopped = False
+        self._mutex = QMutex()
+        self.setAutoDelete(True)
+
+    def stop(self):
+        """Request worker to stop after the batch currently being moved."""
+        with QMutexLocker(self._mutex):
+            self._stopped = True
+
+    def is_stopped(self) -> bool:
+        """Check if stop was requested."""
+        with QMutexLocker(self._mutex):
+            return self._stopped
+
+    def run(self):
+        """Move files to trash. Runs in thread pool thread."""
+        deleted: List[str] = []
+        failed: List[tuple] = []
+        timer = QElapsedTimer()
+        timer.start()
+        last_emit_ms = -self.PROGRESS_INTERVAL_MS
+
+        batch_size = FileService.TRASH_BATCH_SIZE
+        try:
+            for start in range(0, len(self.file_paths), batch_size):
+                if self.is_stopped():
+                    break
+                batch = self.file_paths[start:start + batch_size]
+                # Continue with other files even if some of the batch fail
+                batch_failed = FileService.move_batch_to_trash(batch)
+                failed.extend(batch_failed)
+                failed_paths = {path for path, _ in batch_failed}
+
+                for path in batch:
+                    if path in failed_paths:
+                        continue
+                    deleted.append(path)
+                    logger.info(f"DELETED | {path} | {bytes_to_human(self.file_sizes.get(path, 0))}")
+
+                now_ms = timer.elapsed()
+                if deleted and now_ms - last_emit_ms >= self.PROGRESS_INTERVAL_MS:
+                    self.signals.progress.emit(len(deleted), deleted[-1])
+                    last_emit_ms = now_ms
+        except Exception as e:
+            logger.exception(f"DeleteWorker failed: {e}")
+        finally:
+            self.signals.finished.emit(deleted, failed, self.is_stopped())
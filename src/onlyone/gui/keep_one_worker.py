@@ -1,6 +1,7 @@
 from PySide6.QtCore import QRunnable, QObject, Signal, QMutex, QMutexLocker
 from onlyone.services.duplicate_service import DuplicateService
 from onlyone.core.models import DuplicateGroup
+from onlyone.reporter import format_deletion_preview
 from typing import List
 import logging
 
@@ -9,7 +10,7 @@ logger = logging.getLogger(__name__)
 
 class KeepOneWorkerSignals(QObject):
     """Signals for KeepOneWorker."""
-    finished = Signal(list, list)  # files_to_delete, updated_groups
+    finished = Signal(object, object, object, str)  # files_to_delete, updated_groups, space_saved, preview_text
     error = Signal(str)
 
 
@@ -17,6 +18,8 @@ class KeepOneWorker(QRunnable):
     """
     Worker to calculate files to delete for 'Keep One File Per Group' operation.
     Runs in background thread to avoid UI freeze.
+    Also sums the space to be saved and formats the confirmation preview,
+    both of which walk every file.
     """
 
     def __init__(self, duplicate_groups: List[DuplicateGroup]):
@@ -51,7 +54,14 @@ class KeepOneWorker(QRunnable):
             if self.is_stopped():
                 return
 
-            self.signals.finished.emit(files_to_delete, updated_groups)
+            # Every file after the first of a group is deleted
+            space_saved = sum(f.size for g in self.duplicate_groups for f in g.files[1:])
+            preview_text = format_deletion_preview(self.duplicate_groups, files_to_delete, space_saved)
+
+            if self.is_stopped():
+                return
+
+            self.signals.finished.emit(files_to_delete, updated_groups, space_saved, preview_text)
 
         except Exception as e:
             logger.exception(f"KeepOneWorker failed: {e}")
@@ -21,6 +21,7 @@ def main():
     window.show()
 
     exit_code = app.exec()
+    window.settings_manager.wait_for_writes()
     cleanup_logging()
     sys.exit(exit_code)
 
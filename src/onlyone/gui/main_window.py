@@ -6,64 +6,175 @@ OnlyOne GUI Application
 A PySide6-based graphical interface for finding and removing duplicate files.
 """
 import os
-import time
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 
 from PySide6.QtWidgets import (
     QMainWindow, QFileDialog,
     QDialog, QMessageBox,
-    QProgressDialog, QApplication, QListWidgetItem,
+    QProgressDialog, QListWidget, QListWidgetItem, QSpinBox, QComboBox,
 )
-from PySide6.QtCore import Qt, QSettings, QThreadPool, QTimer
+from PySide6.QtCore import Qt, QSettings, QThreadPool, QTimer, QElapsedTimer, QSignalBlocker
 from onlyone.core.models import DeduplicationParams, File, DuplicateGroup
 from onlyone.core.sorter import Sorter
 from onlyone.core.measurer import bytes_to_human
-from onlyone.services.file_service import FileService
 from onlyone.services.duplicate_service import DuplicateService
-from onlyone.gui.custom_widgets.favourite_dirs_dialog import FavouriteDirsDialog
 from onlyone.gui.worker import DeduplicateWorker
 from onlyone.gui.main_window_ui import Ui_MainWindow
-from onlyone.reporter import format_deletion_preview, format_deletion_result
+from onlyone.reporter import format_deletion_result
 from onlyone.gui.custom_widgets.deletion_confirm_dialog import DeletionConfirmDialog
+from onlyone.gui.custom_widgets.preview_disk_cache import PreviewDiskCache
 from onlyone.gui.keep_one_worker import KeepOneWorker
+from onlyone.gui.delete_worker import DeleteWorker
+from onlyone.gui.settings_writer import SettingsWriter
 from onlyone.logging_config import get_logger, cleanup_logging
 from onlyone import __version__
 from onlyone.logging_config import LOG_FILE
 
+# Static About dialog text, formatted once at import (version and log path do not change)
+_ABOUT_TEXT = f'''
+<b>OnlyOne v{__version__}</b><br>
+A tool to find and remove duplicate files.<br><br>
+
+Check <a href="https://github.com/initumX/onlyone">OnlyOne GitHub</a> for help<br><br>
+Enjoying OnlyOne? Consider starring the project on GitHub!<br><br>
+
+<b>NOTE</b><br>
+No files are deleted until you click "Keep OnlyOne File Per Group" <br>
+or manually delete a file via the context menu. Even then, files are <br>
+safely moved to the system trash (not permanently erased), and all <br>
+deletion operations are recorded in the log file: <br>
+{LOG_FILE}<br><br>
+
+© Copyright (c) 2026 initumX (initum.x@gmail.com)<br><br>
+License: MIT License<br>
+'''
+
+# Shared by all SettingsManager instances, see _shared_settings()
+_settings = None
+
+
+def _shared_settings() -> QSettings:
+    """Process-wide QSettings instance, created on first use and reused afterwards."""
+    global _settings
+    if _settings is None:
+        _settings = QSettings("InitumSoft", "OnlyOne")
+    return _settings
+
 
 class SettingsManager:
-    """Manages application settings persistence using QSettings."""
+    """
+    Manages application settings persistence using QSettings.
+
+    Values are cached in memory: each key is read from the backend (registry on
+    Windows, INI/plist elsewhere) only the first time, and writes are buffered
+    and committed in one pass by flush(). Only values that differ from the cache
+    are written. The backend write itself runs in a SettingsWriter on a
+    single-thread pool (writes stay in order); call wait_for_writes() before
+    the process exits.
+    """
     def __init__(self):
-        self.settings = QSettings("InitumSoft", "OnlyOne")
+        self.settings = _shared_settings()
+        self._pending: Dict[str, Any] = {}
+        self._cache: Dict[str, Any] = {}  # last known backend value per key (read or written)
+        self._write_pool = QThreadPool()
+        self._write_pool.setMaxThreadCount(1)
 
     def save_settings(self, key: str, value: Any) -> None:
-        """Save a setting value by key."""
-        self.settings.setValue(key, value)
+        """Save a setting value by key (buffered until flush())."""
+        self._pending[key] = value
 
     def load_settings(self, key: str, default: Any = None) -> Any:
         """Load a setting value by key with optional default."""
-        return self.settings.value(key, default)
+        return self._cached_value(key, default)
+
+    def load_many(self, defaults: Dict[str, Any]) -> Dict[str, Any]:
+        """Load several settings in one pass, each converted to the type of its default."""
+        return {key: self._cached_value(key, default, type=type(default)) for key, default in defaults.items()}
+
+    def _cached_value(self, key: str, default: Any, **value_kwargs) -> Any:
+        """Buffered value, else cached value, else read the backend once and cache it."""
+        if key in self._pending:
+            return self._pending[key]
+        if key not in self._cache:
+            self._cache[key] = self.settings.value(key, default, **value_kwargs)
+        value = self._cache[key]
+        # Hand out copies of lists so in-place edits by the caller cannot alter the cache
+        return list(value) if isinstance(value, list) else value
+
+    def save_many(self, values: Dict[str, Any]) -> None:
+        """Save several settings at once and commit them with a single sync()."""
+        self._pending.update(values)
+        self.flush()
+
+    def flush(self) -> None:
+        """Hand all values that differ from the cache to a background SettingsWriter."""
+        changed = {key: value for key, value in self._pending.items()
+                   if key not in self._cache or self._cache[key] != value}
+        self._pending.clear()
+        if not changed:
+            return
+        # Copy lists so later in-place edits by the caller are still seen as changes
+        self._cache.update({key: list(value) if isinstance(value, list) else value
+                            for key, value in changed.items()})
+        writer = SettingsWriter(changed, self.settings.organizationName(), self.settings.applicationName())
+        self._write_pool.start(writer)
+
+    def wait_for_writes(self, msecs: int = -1) -> bool:
+        """Block until queued settings writes are on disk. Returns False on timeout."""
+        return self._write_pool.waitForDone(msecs)
 
 
 class MainWindow(QMainWindow):
     """Main application window using composition with Ui_MainWindow."""
 
+    # Defaults for the scalar settings read by restore_settings (value type = stored type)
+    _SETTINGS_DEFAULTS = {
+        "min_size": 100,
+        "max_size": 100,
+        "min_unit_index": 0,
+        "max_unit_index": 1,
+        "boost_mode": 0,
+        "dedupe_mode": 1,
+        "extensions": "",
+        "max_groups_index": 4,
+        "ordering_mode": 0,
+        "preview_disk_cache": False,
+    }
+
+    # Binary shifts for the size unit combos (see Ui_MainWindow.create_size_input): value << shift
+    _UNIT_SHIFT = {"KB": 10, "MB": 20, "GB": 30}
+
     def __init__(self):
         super().__init__()
         self.keep_one_worker = None
+        self.delete_worker = None
+        self._delete_request = None
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
 
         # Local state storage
         self.files: List = []
         self.duplicate_groups: List = []
+        self._path_index: Dict[str, DuplicateGroup] = {}  # file path -> group, see _set_duplicate_groups
         self.favourite_dirs: List[str] = []
         self.excluded_dirs: List[str] = []
+        # Folder dialogs are built on first use and reused (see set_dirs)
+        self._favourite_dialog = None
+        self._excluded_dialog = None
+        self._dir_picker = None
         self.settings_manager = SettingsManager()
         self.worker = None  # Holds reference to current worker for cancellation
+        self._scan_sort_order = None  # Order the running scan sorts its groups by
         self.progress_dialog = None
         self.original_image_preview_size = None
+        self._preview_disk_cache_enabled = False  # a PreviewDiskCache is given to the preview when built
+
+        # Throttles progress dialog repaints (see update_progress)
+        self._progress_timer = QElapsedTimer()
+        self._progress_timer.start()
+        self._last_progress_ms = 0
+        self._last_progress_stage = None
 
         self.logger = get_logger("onlyone.gui.main_window")
 
@@ -72,15 +183,28 @@ class MainWindow(QMainWindow):
         self._statusbar_unlock_timer.setSingleShot(True)
         self._statusbar_unlock_timer.timeout.connect(self._unlock_statusbar)
 
+        # Debounces splitter re-layout while the window is being resized
+        self._pending_splitter_ratio = None
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._apply_splitter_ratio)
+
+        # Coalesces bursts of settings edits into one save_settings() call
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(250)
+        self._settings_save_timer.timeout.connect(self.save_settings)
 
         self._ordering_connected = False
         self.setup_connections()
-        # Defer settings restore to ensure UI is fully initialized
-        QTimer.singleShot(0, self.restore_settings)
+        # Settings are read on first show (see showEvent), not while constructing the window
+        self._restore_scheduled = False
+        self._settings_restored = False
 
     def setup_connections(self):
         """Connect UI signals to handler methods."""
-        self.ui.groups_list.file_selected.connect(self.ui.image_preview.set_file)
+        self.ui.groups_list.file_selected.connect(self.show_preview)
         self.ui.groups_list.file_selected.connect(self.on_file_selected_statusbar)
         self.ui.select_dir_button.clicked.connect(self.select_root_folder)
         self.ui.remove_dir_button.clicked.connect(self.remove_selected_folder)
@@ -90,11 +214,38 @@ class MainWindow(QMainWindow):
         self.ui.keep_one_button.clicked.connect(self.keep_one_file_per_group)
         self.ui.groups_list.delete_requested.connect(self.handle_delete_files)
         self.ui.about_button.clicked.connect(self.show_about_dialog)
+        self.ui.preview_cache_checkbox.toggled.connect(self.on_preview_cache_toggled)
+
+        # Size filters are cached as plain ints whenever a size widget changes
+        for widget_signal in (self.ui.min_size_spin.valueChanged, self.ui.min_unit_combo.currentTextChanged,
+                              self.ui.max_size_spin.valueChanged, self.ui.max_unit_combo.currentTextChanged):
+            widget_signal.connect(self._update_size_filters)
+        self._update_size_filters()
+
+        # Persist settings shortly after the user stops editing them
+        for widget_signal in (self.ui.min_size_spin.valueChanged, self.ui.max_size_spin.valueChanged,
+                              self.ui.min_unit_combo.currentIndexChanged, self.ui.max_unit_combo.currentIndexChanged,
+                              self.ui.boost_combo.currentIndexChanged, self.ui.dedupe_mode_combo.currentIndexChanged,
+                              self.ui.ordering_combo.currentIndexChanged, self.ui.max_groups_combo.currentIndexChanged,
+                              self.ui.extension_filter_input.textChanged, self.ui.splitter.splitterMoved,
+                              self.ui.preview_cache_checkbox.toggled,
+                              self.ui.root_dir_list.model().rowsInserted, self.ui.root_dir_list.model().rowsRemoved):
+            widget_signal.connect(self._schedule_settings_save)
 
         if not self._ordering_connected:
             self.ui.ordering_combo.currentIndexChanged.connect(self.on_ordering_changed)
             self._ordering_connected = True
 
+    def _schedule_settings_save(self, *_signal_args):
+        """(Re)start the settings save timer; signal arguments are ignored."""
+        # Not connected to QTimer.start directly: start(int) would take e.g. a spin value as interval
+        self._settings_save_timer.start()
+
+    def _set_duplicate_groups(self, groups: List[DuplicateGroup]):
+        """Replace the current duplicate groups and rebuild the path -> group index."""
+        self.duplicate_groups = groups
+        self._path_index = DuplicateService.build_path_index(groups)
+
     def on_ordering_changed(self):
         """Re-sort all duplicate groups when ordering mode changes."""
         sort_order = self.ui.ordering_combo.currentData()
@@ -102,19 +253,47 @@ class MainWindow(QMainWindow):
         self.ui.groups_list.set_groups(self.duplicate_groups)
 
     def resizeEvent(self, event):
-        """Handle window resize to maintain splitter proportions."""
+        """Handle window resize to maintain splitter proportions (applied once the resize settles)."""
         super().resizeEvent(event)
-        sizes = self.ui.splitter.sizes()
-        total = sum(sizes)
-        if total > 0:
-            ratio = sizes[0] / total
-            new_left = int(self.ui.splitter.width() * ratio)
-            new_right = self.ui.splitter.width() - new_left
-            self.ui.splitter.setSizes([new_left, new_right])
+        # Remember the ratio from before the resize burst, re-apply it when it ends
+        if not self._resize_timer.isActive():
+            sizes = self.ui.splitter.sizes()
+            total = sum(sizes)
+            self._pending_splitter_ratio = sizes[0] / total if total > 0 else None
+        self._resize_timer.start()
+
+    def showEvent(self, event):
+        """Restore settings on first show."""
+        super().showEvent(event)
+        if not self._restore_scheduled:
+            self._restore_scheduled = True
+            # Defer settings restore to ensure UI is fully initialized
+            QTimer.singleShot(0, self.restore_settings)
+
+    def _apply_splitter_ratio(self):
+        """Restore the splitter proportions recorded at the start of a resize."""
+        ratio = self._pending_splitter_ratio
+        if ratio is None:
+            return
+        new_left = int(self.ui.splitter.width() * ratio)
+        new_right = self.ui.splitter.width() - new_left
+        self.ui.splitter.setSizes([new_left, new_right])
 
     def select_root_folder(self):
-        """Open folder dialog and add selected path to the list."""
-        dir_path = QFileDialog.getExistingDirectory(self, "Select Folder to Scan")
+        """Show the non-modal folder dialog; the chosen path is added by add_root_folder."""
+        if self._dir_picker is None:
+            # Built once and reused: QFileDialog setup is slow on some platforms
+            self._dir_picker = QFileDialog(self, "Select Folder to Scan")
+            self._dir_picker.setFileMode(QFileDialog.FileMode.Directory)
+            self._dir_picker.setOption(QFileDialog.Option.ShowDirsOnly, True)
+            self._dir_picker.setWindowModality(Qt.WindowModality.NonModal)
+            self._dir_picker.fileSelected.connect(self.add_root_folder)
+        self._dir_picker.show()  # not open(): that would make it window-modal
+        self._dir_picker.raise_()
+        self._dir_picker.activateWindow()
+
+    def add_root_folder(self, dir_path: str):
+        """Add a folder to the scan list (ignores empty paths and folders already listed)."""
         if dir_path:
             # Check for duplicates in the list
             for i in range(self.ui.root_dir_list.count()):
@@ -147,17 +326,18 @@ class MainWindow(QMainWindow):
 
     def select_favourite_dirs(self):
         """Open dialog to manage priority (favourite) directories."""
-        dialog = FavouriteDirsDialog(self, self.favourite_dirs)
+        if self._favourite_dialog is None:
+            from onlyone.gui.custom_widgets.favourite_dirs_dialog import FavouriteDirsDialog
+            self._favourite_dialog = FavouriteDirsDialog(self)
+        dialog = self._favourite_dialog
+        dialog.set_dirs(self.favourite_dirs)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.favourite_dirs = dialog.get_selected_dirs()
-            self.ui.favourite_list_widget.clear()
-            for path in self.favourite_dirs:
-                self.ui.favourite_list_widget.addItem(path)
-
-            if self.files:
-                DuplicateService.update_favourite_status(self.files, self.favourite_dirs)
-                for group in self.duplicate_groups:
-                    group.files.sort(key=lambda f: not f.is_from_fav_dir)
+            self._schedule_settings_save()
+            self.ui.favourite_list_widget.model().set_paths(self.favourite_dirs)
+
+            if self.duplicate_groups:
+                DuplicateService.update_favourite_status_in_groups(self.duplicate_groups, self.favourite_dirs)
                 self.ui.groups_list.set_groups(self.duplicate_groups)
 
             QMessageBox.information(
@@ -168,19 +348,32 @@ class MainWindow(QMainWindow):
 
     def select_excluded_dirs(self):
         """Open dialog to manage excluded directories."""
-        from onlyone.gui.custom_widgets.excluded_dirs_dialog import ExcludedDirsDialog
-        dialog = ExcludedDirsDialog(self, self.excluded_dirs)
+        if self._excluded_dialog is None:
+            from onlyone.gui.custom_widgets.excluded_dirs_dialog import ExcludedDirsDialog
+            self._excluded_dialog = ExcludedDirsDialog(self)
+        dialog = self._excluded_dialog
+        dialog.set_dirs(self.excluded_dirs)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.excluded_dirs = dialog.get_selected_dirs()
-            self.ui.excluded_list_widget.clear()
-            for path in self.excluded_dirs:
-                self.ui.excluded_list_widget.addItem(path)
+            self._schedule_settings_save()
+            self.ui.excluded_list_widget.model().set_paths(self.excluded_dirs)
             QMessageBox.information(
                 self,
                 "Success",
                 f"Excluded Folders Updated: {len(self.excluded_dirs)}"
             )
 
+    @staticmethod
+    def _replace_list_items(list_widget: QListWidget, paths: List[str]) -> None:
+        """Replace all items of a list widget in one batch, without intermediate repaints."""
+        list_widget.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(list_widget):
+                list_widget.clear()
+                list_widget.addItems(paths)
+        finally:
+            list_widget.setUpdatesEnabled(True)
+
     def keep_one_file_per_group(self):
         """Keep one file per duplicate group and move the rest to trash."""
         if not self.duplicate_groups:
@@ -207,7 +400,8 @@ class MainWindow(QMainWindow):
 
         QThreadPool.globalInstance().start(self.keep_one_worker)
 
-    def _on_keep_one_calculated(self, files_to_delete: List[str], updated_groups: List[DuplicateGroup]):
+    def _on_keep_one_calculated(self, files_to_delete: List[str], updated_groups: List[DuplicateGroup],
+                                space_saved: int, preview_text: str):
         """Called when background calculation completes."""
         if self.progress_dialog:
             self.progress_dialog.close()
@@ -217,8 +411,6 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Information", "Nothing to delete")
             return
 
-        space_saved = sum(f.size for g in self.duplicate_groups for f in g.files if f.path in files_to_delete)
-        preview_text = format_deletion_preview(self.duplicate_groups, files_to_delete, space_saved)
         dialog = DeletionConfirmDialog(
             parent=self,
             files_count=len(files_to_delete),
@@ -230,11 +422,8 @@ class MainWindow(QMainWindow):
         if reply != QDialog.DialogCode.Accepted:
             return
 
-        # Store updated_groups for use after deletion
-        self._pending_updated_groups = updated_groups
-
-        # Proceed with deletion
-        self.handle_delete_files(files_to_delete)
+        # Proceed with deletion; updated_groups are applied once it is done
+        self.handle_delete_files(files_to_delete, updated_groups)
 
     def _on_keep_one_error(self, error_message: str):
         """Called when background calculation fails."""
@@ -244,73 +433,81 @@ class MainWindow(QMainWindow):
 
         QMessageBox.critical(self, "Error", f"Error during calculation:\n{error_message}")
 
-    def handle_delete_files(self, file_paths):
-        """Execute file deletion with progress tracking and error handling."""
+    def handle_delete_files(self, file_paths, updated_groups: Optional[List[DuplicateGroup]] = None):
+        """
+        Move files to trash in a background worker, with progress tracking.
+
+        updated_groups, if given, are the groups precomputed for this deletion
+        (see _on_keep_one_calculated); they replace the current groups when every file is deleted.
+        """
         if not file_paths:
             self.ui.statusbar.showMessage("Nothing to delete", 3000)
             return
 
-        self._block_statusbar_from_file_selected = True
+        if self.delete_worker is not None:
+            self.ui.statusbar.showMessage("Deletion already in progress", 3000)
+            return
 
-        file_sizes = {}
-        for group in self.duplicate_groups:
-            for f in group.files:
-                file_sizes[f.path] = f.size
+        self._block_statusbar_from_file_selected = True
 
-        total_space_saved = sum(file_sizes.get(path, 0) for path in file_paths)
-        total = len(file_paths)
+        file_sizes = {f.path: f.size for group in self.duplicate_groups for f in group.files}
+        file_paths = list(file_paths)
+        self._delete_request = (file_paths, file_sizes, updated_groups)
 
         self.progress_dialog = QProgressDialog(
             "Moving files to trash...",
             "Cancel",
-            0, total, self
+            0, len(file_paths), self
         )
         self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
         self.progress_dialog.setWindowTitle("Deleting files")
         self.progress_dialog.show()
 
-        failed_files = []  # List of (path, error) for files that could not be deleted
-        deleted_count = 0
+        self.delete_worker = DeleteWorker(file_paths, file_sizes)
+        self.delete_worker.signals.progress.connect(self._on_delete_progress)
+        self.delete_worker.signals.finished.connect(self._on_delete_finished)
+        self.progress_dialog.canceled.connect(self.delete_worker.stop)
 
-        try:
-            for i, path in enumerate(file_paths):
-                if self.progress_dialog.wasCanceled():
-                    raise Exception("Operation was cancelled by the user.")
-                try:
-                    FileService.move_to_trash(path)
-                    deleted_count += 1
-                    file_size = file_sizes.get(path, 0)
-                    self._log_file_deletion(path, file_size)
-                except Exception as e:
-                    # Continue deleting other files even if one fails
-                    failed_files.append((path, str(e)))
-                    continue
-
-                # Update progress ONLY for successfully deleted files
-                self.progress_dialog.setValue(deleted_count)
-                self.progress_dialog.setLabelText(
-                    f"Deleting: {os.path.basename(path)}"
-                )
-                QApplication.processEvents()
+        QThreadPool.globalInstance().start(self.delete_worker)
+        # Optimistic update: rows come back in _on_delete_finished if their file could not be deleted
+        self.ui.groups_list.hide_files(file_paths)
 
-                # Yield every 100 files for better responsiveness
-                if i % 100 == 0:
-                    time.sleep(0.001)
+    def _on_delete_progress(self, deleted_count: int, path: str):
+        """Updates the deletion progress dialog (progress counts only successfully deleted files)."""
+        if self.progress_dialog is None:
+            return
+        self.progress_dialog.setValue(deleted_count)
+        self.progress_dialog.setLabelText(f"Deleting: {os.path.basename(path)}")
+
+    def _on_delete_finished(self, deleted_paths: List[str], failed_files: List[tuple], was_stopped: bool):
+        """Called when the delete worker is done: updates file lists and reports the result."""
+        self.delete_worker = None
+        file_paths, file_sizes, updated_groups = self._delete_request
+        self._delete_request = None
 
+        if self.progress_dialog:
+            self.progress_dialog.close()
+            self.progress_dialog = None
+
+        deleted_count = len(deleted_paths)
+        total = len(file_paths)
+        total_space_saved = sum(file_sizes.get(path, 0) for path in deleted_paths)
+
+        try:
             # Update file lists ONLY for successfully deleted files
-            successful_files = [path for path in file_paths if path not in [f[0] for f in failed_files]]
+            successful_files = set(deleted_paths)
             self.files = DuplicateService.remove_files_from_file_list(self.files, successful_files)
 
-            # Use pre-calculated updated_groups if available, otherwise recalculate
-            if hasattr(self, '_pending_updated_groups'):
-                updated_groups = self._pending_updated_groups
-                delattr(self, '_pending_updated_groups')
+            # Pre-calculated updated_groups are valid only if every requested file was deleted
+            group_count = len(self.duplicate_groups)
+            if updated_groups is not None and deleted_count == total:
+                self._set_duplicate_groups(updated_groups)
             else:
-                updated_groups = DuplicateService.remove_files_from_groups(self.duplicate_groups, successful_files)
-
-            removed_group_count = len(self.duplicate_groups) - len(updated_groups)
-            self.duplicate_groups = updated_groups
-            self.ui.groups_list.set_groups(updated_groups)
+                self.duplicate_groups = DuplicateService.remove_files_using_index(
+                    self.duplicate_groups, self._path_index, successful_files
+                )
+            removed_group_count = group_count - len(self.duplicate_groups)
+            self.ui.groups_list.remove_files(successful_files, self.duplicate_groups)
 
             # === SHOW FINAL RESULT ===
             result_text = format_deletion_result(
@@ -319,6 +516,8 @@ class MainWindow(QMainWindow):
                 total_space_saved,
                 failed_files
             )
+            if was_stopped:
+                result_text = f"Operation was cancelled by the user.\n{result_text}"
             # Add log location info
             log_path = Path.home() / ".onlyone" / "logs" / "app.log"
             result_text += f"\n\nℹ️  Deletion logs saved to:\n{log_path}"
@@ -327,7 +526,7 @@ class MainWindow(QMainWindow):
             result_box = QMessageBox(self)
             result_box.setWindowTitle("Deletion Complete")
             result_box.setIcon(
-                QMessageBox.Icon.Warning if failed_files else QMessageBox.Icon.Information
+                QMessageBox.Icon.Warning if failed_files or was_stopped else QMessageBox.Icon.Information
             )
             result_box.setText(result_text)
             result_box.setStandardButtons(QMessageBox.StandardButton.Ok)
@@ -339,15 +538,10 @@ class MainWindow(QMainWindow):
             if removed_group_count > 0:
                 status_msg += f" | {removed_group_count} groups removed"
             self.ui.statusbar.showMessage(status_msg, 5000)
-            self._statusbar_unlock_timer.start(500)
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error occurred:\n{e}")
-            self._statusbar_unlock_timer.start(500)
         finally:
-            if self.progress_dialog:
-                self.progress_dialog.close()
-                self.progress_dialog = None
             self._statusbar_unlock_timer.start(500)
 
     def _unlock_statusbar(self):
@@ -359,40 +553,9 @@ class MainWindow(QMainWindow):
         QMessageBox.about(
             self,
             "About",
-            f'''
-            <b>OnlyOne v{__version__}</b><br>
-            A tool to find and remove duplicate files.<br><br>
-            
-            Check <a href="https://github.com/initumX/onlyone">OnlyOne GitHub</a> for help<br><br>
-            Enjoying OnlyOne? Consider starring the project on GitHub!<br><br>
-            
-            <b>NOTE</b><br>
-            No files are deleted until you click "Keep OnlyOne File Per Group" <br>
-            or manually delete a file via the context menu. Even then, files are <br>
-            safely moved to the system trash (not permanently erased), and all <br>
-            deletion operations are recorded in the log file: <br>
-            {LOG_FILE}<br><br>
-            
-            © Copyright (c) 2026 initumX (initum.x@gmail.com)<br><br>
-            License: MIT License<br>
-            '''
+            _ABOUT_TEXT
         )
 
-    def _log_file_deletion(self, file_path: str, file_size: int = 0) -> None:
-        """Log file deletion."""
-        try:
-            from onlyone.core.measurer import bytes_to_human
-            size_human = bytes_to_human(file_size)
-            self.logger.info(f"DELETED | {file_path} | {size_human}")
-        except (ValueError, OSError) as e:
-            self.logger.debug(f"Failed to log deletion of {file_path}: {e}", exc_info=True)
-        except Exception as e:
-            self.logger.warning(
-                f"Unexpected error logging deletion of {file_path}: {type(e).__name__}: {e}",
-                exc_info=True
-            )
-
-
     def _cleanup_progress_dialog(self):
         """
         Safely closes, disconnects, and schedules deletion of the progress dialog.
@@ -437,8 +600,25 @@ class MainWindow(QMainWindow):
                     root_dirs.append(path)
         return root_dirs
 
+    def _commit_size_inputs(self):
+        """Apply digits still being typed in the size spin boxes (keyboard tracking is off)."""
+        self.ui.min_size_spin.interpretText()
+        self.ui.max_size_spin.interpretText()
+
+    def _update_size_filters(self):
+        """Recompute the cached min/max size filters from the size widgets."""
+        self._min_size_bytes = self._size_in_bytes(self.ui.min_size_spin, self.ui.min_unit_combo)
+        self._max_size_bytes = self._size_in_bytes(self.ui.max_size_spin, self.ui.max_unit_combo)
+
+    @classmethod
+    def _size_in_bytes(cls, spin: QSpinBox, unit_combo: QComboBox) -> int:
+        """Size filter in bytes: spin value shifted by the unit (combo only offers known units)."""
+        return spin.value() << cls._UNIT_SHIFT[unit_combo.currentText()]
+
     def start_deduplication(self):
         """Start the deduplication process with current UI settings."""
+        self._commit_size_inputs()
+
         # Collect all root directories from the list widget
         root_dirs = self._collect_root_dirs()
         if not root_dirs:
@@ -453,14 +633,6 @@ class MainWindow(QMainWindow):
         # Ensure previous dialog is cleaned up
         self._cleanup_progress_dialog()
 
-        # Parse size filters
-        min_size_value = self.ui.min_size_spin.value()
-        min_unit = self.ui.min_unit_combo.currentText()
-        max_size_value = self.ui.max_size_spin.value()
-        max_unit = self.ui.max_unit_combo.currentText()
-        min_size_str = f"{min_size_value}{min_unit}"
-        max_size_str = f"{max_size_value}{max_unit}"
-
         extensions = self.ui.extension_filter_input.text().split()
 
         # Get boost, mode and sort order from UI controls
@@ -471,10 +643,10 @@ class MainWindow(QMainWindow):
 
         # Create unified parameters object with multiple root directories
         try:
-            params = DeduplicationParams.from_human_readable(
+            params = DeduplicationParams(
                 root_dirs=root_dirs,
-                min_size_str=min_size_str,
-                max_size_str=max_size_str,
+                min_size_bytes=self._min_size_bytes,
+                max_size_bytes=self._max_size_bytes,
                 extensions=extensions,
                 favourite_dirs=self.favourite_dirs,
                 excluded_dirs=self.excluded_dirs,
@@ -506,6 +678,7 @@ class MainWindow(QMainWindow):
         self.progress_dialog.canceled.connect(self._cancel_worker)
 
         # Launch worker via thread pool
+        self._scan_sort_order = sort_order
         self.worker = DeduplicateWorker(params)
         self.worker.signals.progress.connect(self.update_progress)
         self.worker.signals.finished.connect(self.on_deduplicate_finished)
@@ -525,6 +698,15 @@ class MainWindow(QMainWindow):
         if not hasattr(self, 'progress_dialog') or self.progress_dialog is None:
             return
 
+        # Repaint at most once per ~16 ms; stage changes and final updates always pass
+        now_ms = self._progress_timer.elapsed()
+        is_final = total is not None and current >= total
+        if (stage == self._last_progress_stage and not is_final
+                and now_ms - self._last_progress_ms < 16):
+            return
+        self._last_progress_ms = now_ms
+        self._last_progress_stage = stage
+
         try:
             if total is not None and total > 0:
                 percent = int((current / total) * 100)
@@ -545,9 +727,12 @@ class MainWindow(QMainWindow):
         # Reset worker reference (worker auto-deletes itself)
         self.worker = None
 
-        # Process results
-        self.duplicate_groups = duplicate_groups
-        self.on_ordering_changed()
+        # Process results: the engine already sorted files by the order the scan started with
+        self._set_duplicate_groups(duplicate_groups)
+        if self.ui.ordering_combo.currentData() != self._scan_sort_order:
+            self.on_ordering_changed()
+        else:
+            self.ui.groups_list.set_groups(self.duplicate_groups)
 
         # Show statistics AFTER event loop processes dialog cleanup
         def show_stats():
@@ -588,14 +773,36 @@ class MainWindow(QMainWindow):
             self.worker.stop()
             self.worker = None
 
+        # Stop trashing further files; files already moved stay in trash
+        if self.delete_worker:
+            self.delete_worker.stop()
+
         # Safely cleanup progress dialog (handles already-None case)
         self._cleanup_progress_dialog()
 
+        self._settings_save_timer.stop()
         self.save_settings()
 
         cleanup_logging()
         super().closeEvent(event)
 
+    def show_preview(self, file: File):
+        """Shows the selected file in the image preview (built on the first selection)."""
+        if not self.ui.has_image_preview and self._preview_disk_cache_enabled:
+            self.ui.image_preview.disk_cache = PreviewDiskCache()
+        self.ui.image_preview.set_file(file)
+
+    def on_preview_cache_toggled(self, enabled: bool):
+        """Turns the preview disk cache on or off; turning it off deletes the cached previews."""
+        self._preview_disk_cache_enabled = enabled
+        cache = PreviewDiskCache()
+        if self.ui.has_image_preview:
+            self.ui.image_preview.disk_cache = cache if enabled else None
+        if not enabled:
+            # Deleting up to MAX_BYTES of entries would stall the GUI thread
+            from onlyone.gui.custom_widgets.image_preview_label import clear_disk_cache
+            clear_disk_cache(cache)
+
     def on_file_selected_statusbar(self, file: File):
         """Updates file selection status bar."""
         if self._block_statusbar_from_file_selected:
@@ -604,65 +811,68 @@ class MainWindow(QMainWindow):
             self.ui.statusbar.showMessage(file.path)
 
     def save_settings(self):
-        """Persist current UI state to settings."""
-        # Save root directories as a list
-        root_dirs = self._collect_root_dirs()
-        self.settings_manager.save_settings("root_dirs", root_dirs)
-
-        self.settings_manager.save_settings("min_size", self.ui.min_size_spin.value())
-        self.settings_manager.save_settings("max_size", self.ui.max_size_spin.value())
-        self.settings_manager.save_settings("min_unit_index", self.ui.min_unit_combo.currentIndex())
-        self.settings_manager.save_settings("max_unit_index", self.ui.max_unit_combo.currentIndex())
-        self.settings_manager.save_settings("boost_mode", self.ui.boost_combo.currentIndex())
-        self.settings_manager.save_settings("dedupe_mode", self.ui.dedupe_mode_combo.currentIndex())
-        self.settings_manager.save_settings("extensions", self.ui.extension_filter_input.text())
-        self.settings_manager.save_settings("max_groups_index", self.ui.max_groups_combo.currentIndex())
-        self.settings_manager.save_settings("splitter_sizes", list(self.ui.splitter.sizes()))
-        self.settings_manager.save_settings("favourite_dirs", self.favourite_dirs)
-        self.settings_manager.save_settings("excluded_dirs", self.excluded_dirs)
-        self.settings_manager.save_settings("ordering_mode", self.ui.ordering_combo.currentIndex())
+        """Persist current UI state to settings (SettingsManager writes only the changed keys)."""
+        if not self._settings_restored:
+            # Not restored yet: the widgets still hold defaults, not the user's settings
+            return
+        self._commit_size_inputs()
+        self.settings_manager.save_many({
+            "root_dirs": self._collect_root_dirs(),
+            "min_size": self.ui.min_size_spin.value(),
+            "max_size": self.ui.max_size_spin.value(),
+            "min_unit_index": self.ui.min_unit_combo.currentIndex(),
+            "max_unit_index": self.ui.max_unit_combo.currentIndex(),
+            "boost_mode": self.ui.boost_combo.currentIndex(),
+            "dedupe_mode": self.ui.dedupe_mode_combo.currentIndex(),
+            "extensions": self.ui.extension_filter_input.text(),
+            "max_groups_index": self.ui.max_groups_combo.currentIndex(),
+            "splitter_sizes": list(self.ui.splitter.sizes()),
+            "favourite_dirs": self.favourite_dirs,
+            "excluded_dirs": self.excluded_dirs,
+            "ordering_mode": self.ui.ordering_combo.currentIndex(),
+            "preview_disk_cache": self.ui.preview_cache_checkbox.isChecked(),
+        })
+
+    @staticmethod
+    def _as_path_list(value: Any) -> List[str]:
+        """Normalize a stored directory list (QSettings may return a list or a ';'-separated string)."""
+        if isinstance(value, str):
+            return [d.strip() for d in value.split(";") if d.strip()]
+        if isinstance(value, list):
+            return value
+        return []
 
     def restore_settings(self):
         """Restore UI state from persisted settings with migration support."""
         # Load root directories with migration from old single 'root_dir' setting
         saved_dirs = self.settings_manager.load_settings("root_dirs", None)
 
-        # Migration: if new format doesn't exist, try old format
+        # Migration: if new format doesn't exist, try old format (a single path string;
+        # _as_path_list strips it and maps an empty value to [])
         if saved_dirs is None:
-            old_dir = self.settings_manager.load_settings("root_dir", "")
-            if old_dir and isinstance(old_dir, str) and old_dir.strip():
-                saved_dirs = [old_dir.strip()]
-            else:
-                saved_dirs = []
+            saved_dirs = self.settings_manager.load_settings("root_dir", "")
 
-        # Handle different possible types from QSettings
-        if isinstance(saved_dirs, str):
-            # Might be serialized as semicolon-separated string
-            saved_dirs = [d.strip() for d in saved_dirs.split(";") if d.strip()]
-        elif not isinstance(saved_dirs, list):
-            saved_dirs = []
+        saved_dirs = self._as_path_list(saved_dirs)
 
         # Populate the list widget
-        self.ui.root_dir_list.clear()
         if saved_dirs:
-            for path in saved_dirs:
-                self.ui.root_dir_list.addItem(path)
+            self._replace_list_items(self.ui.root_dir_list, saved_dirs)
         else:
+            self.ui.root_dir_list.clear()
             # Add disabled placeholder item for empty state
             placeholder = QListWidgetItem("No folders selected — click 'Add Folder' to begin")
             placeholder.setFlags(Qt.ItemFlag.NoItemFlags)
             self.ui.root_dir_list.addItem(placeholder)
 
-        self.ui.min_size_spin.setValue(int(self.settings_manager.load_settings("min_size", 100)))
-        self.ui.max_size_spin.setValue(int(self.settings_manager.load_settings("max_size", 100)))
-        self.ui.min_unit_combo.setCurrentIndex(int(self.settings_manager.load_settings("min_unit_index", 0)))
-        self.ui.max_unit_combo.setCurrentIndex(int(self.settings_manager.load_settings("max_unit_index", 1)))
-        self.ui.boost_combo.setCurrentIndex(int(self.settings_manager.load_settings("boost_mode", 0)))
-        self.ui.dedupe_mode_combo.setCurrentIndex(int(self.settings_manager.load_settings("dedupe_mode", 1)))
-        self.ui.extension_filter_input.setText(self.settings_manager.load_settings("extensions", ""))
-
-        max_groups_index = int(self.settings_manager.load_settings("max_groups_index", 4))
-        self.ui.max_groups_combo.setCurrentIndex(max_groups_index)
+        values = self.settings_manager.load_many(self._SETTINGS_DEFAULTS)
+        self.ui.min_size_spin.setValue(values["min_size"])
+        self.ui.max_size_spin.setValue(values["max_size"])
+        self.ui.min_unit_combo.setCurrentIndex(values["min_unit_index"])
+        self.ui.max_unit_combo.setCurrentIndex(values["max_unit_index"])
+        self.ui.boost_combo.setCurrentIndex(values["boost_mode"])
+        self.ui.dedupe_mode_combo.setCurrentIndex(values["dedupe_mode"])
+        self.ui.extension_filter_input.setText(values["extensions"])
+        self.ui.max_groups_combo.setCurrentIndex(values["max_groups_index"])
 
         splitter_sizes = self.settings_manager.load_settings("splitter_sizes", None)
         if splitter_sizes and isinstance(splitter_sizes, (list, tuple)):
@@ -671,28 +881,18 @@ class MainWindow(QMainWindow):
             self.ui.splitter.setSizes([400, 600])
 
         # Restore favourite directories
-        saved_fav = self.settings_manager.load_settings("favourite_dirs", [])
-        if isinstance(saved_fav, str):
-            saved_fav = [d.strip() for d in saved_fav.split(";") if d.strip()]
-        elif not isinstance(saved_fav, list):
-            saved_fav = []
-        self.favourite_dirs = saved_fav
-        self.ui.favourite_list_widget.clear()
-        for path in self.favourite_dirs:
-            self.ui.favourite_list_widget.addItem(path)
+        self.favourite_dirs = self._as_path_list(self.settings_manager.load_settings("favourite_dirs", []))
+        self.ui.favourite_list_widget.model().set_paths(self.favourite_dirs)
 
         # Restore excluded directories
-        saved_excl = self.settings_manager.load_settings("excluded_dirs", [])
-        if isinstance(saved_excl, str):
-            saved_excl = [d.strip() for d in saved_excl.split(";") if d.strip()]
-        elif not isinstance(saved_excl, list):
-            saved_excl = []
-        self.excluded_dirs = saved_excl
-        self.ui.excluded_list_widget.clear()
-        for path in self.excluded_dirs:
-            self.ui.excluded_list_widget.addItem(path)
+        self.excluded_dirs = self._as_path_list(self.settings_manager.load_settings("excluded_dirs", []))
+        self.ui.excluded_list_widget.model().set_paths(self.excluded_dirs)
+
+        # Preview disk cache is opt-in (see on_preview_cache_toggled)
+        self.ui.preview_cache_checkbox.setChecked(values["preview_disk_cache"])
 
         # Restore ordering mode
-        ordering_index = int(self.settings_manager.load_settings("ordering_mode", 0))
-        self.ui.ordering_combo.setCurrentIndex(ordering_index)
-        self.on_ordering_changed()
\ No newline at end of file
+        self.ui.ordering_combo.setCurrentIndex(values["ordering_mode"])
+        self.on_ordering_changed()
+
+        self._settings_restored = True
\ No newline at end of file
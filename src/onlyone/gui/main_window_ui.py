@@ -1,17 +1,117 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QLineEdit, QComboBox, QSpinBox,
-    QListWidget, QGroupBox, QSizePolicy, QSplitter, QAbstractItemView, QMainWindow,
+    QPushButton, QLineEdit, QComboBox, QSpinBox, QCheckBox,
+    QListWidget, QListView, QGroupBox, QSizePolicy, QSplitter, QAbstractItemView, QMainWindow,
     QStatusBar
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSignalBlocker
 from onlyone.gui.custom_widgets.duplicate_groups_list import DuplicateGroupsList
-from onlyone.gui.custom_widgets.image_preview_label import ImagePreviewLabel
+from onlyone.gui.custom_widgets.folder_list_model import FolderListModel
+from onlyone.gui.custom_widgets.preview_disk_cache import PreviewDiskCache
 from onlyone.core.models import DeduplicationMode
 from onlyone.core.models import SortOrder, BoostMode
 
+if TYPE_CHECKING:
+    from onlyone.gui.custom_widgets.image_preview_label import ImagePreviewLabel
+
+
+# Items of the min/max size unit combos
+_SIZE_UNITS = ("KB", "MB", "GB")
+
+# (text, userData) items of the max groups combo; None = no limit
+_MAX_GROUPS_CHOICES = (
+    ("100", 100),
+    ("300", 300),
+    ("600", 600),
+    ("1,000", 1000),
+    ("3,000 (Default)", 3000),
+    ("6,000", 6000),
+    ("9,000", 9000),
+    ("12,000 (Slow)", 12000),
+    ("Unlimit (Not recommended)", None),
+)
+
+# Size policies shared by the widgets below (QSizePolicy is a value type, copied on set)
+_FIXED_POLICY = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+_EXPANDING_FIXED_POLICY = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+_PREFERRED_POLICY = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+_IGNORED_POLICY = QSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
+
+# (display name, member) items of the enum combos, built once at import
+_BOOST_ITEMS = tuple((member.display_name, member) for member in BoostMode)
+_DEDUPE_MODE_ITEMS = tuple((member.display_name, member) for member in DeduplicationMode)
+_ORDERING_ITEMS = tuple((member.display_name, member) for member in SortOrder)
+
+# Shown in the preview slot until the first file is selected (see image_preview)
+_PREVIEW_PLACEHOLDER_TEXT = "Select an image or pdf file to preview..."
+
+# Multi-line tooltip texts (module constants, not rebuilt per setupUi call)
+_EXTENSIONS_TOOLTIP = (
+    "Enter file extensions separated by spaces (e.g., .jpg .png .pdf). "
+    "Leave empty to disable extension filtering. "
+    "Extensions can be with or without leading dot (both .jpg and jpg work)."
+)
+_MAX_GROUPS_TOOLTIP = (
+    "Limit the number of duplicate groups shown in GUI.\n"
+    "Higher values may slow down the interface.\n"
+    "CLI remains unlimited."
+)
+_FAVOURITE_DIRS_TOOLTIP = (
+    "Files from these folders are prioritized to keep (goes first, as 'original') in each group."
+)
+_EXCLUDED_DIRS_TOOLTIP = (
+    "Files from these folders will be excluded from scanning."
+)
+_BOOST_TOOLTIP = (
+    "Boost for initial file grouping\n"
+    "Size               = Compare only files of the same size\n"
+    "Size + Extension   = Compare only files of the same size and extension\n"
+    "Size + Filename    = Compare only files of the same size and filename\n"
+    "Size + Fuzzy Filename = Compare only files of the same size and similar filename"
+)
+_DEDUPE_MODE_TOOLTIP = (
+    "NORMAL  = Boost + checksums from 3 parts of the file (generally reliable)\n"
+    "FULL    = Boost + checksums from 2 parts + entire file (very slow for large files)"
+)
+_ORDERING_TOOLTIP = (
+    "Which file should be kept/considered as 'original'?\n"
+    "- The file closest to the root folder (shortest path)\n"
+    "- The file with the shortest filename"
+)
+_FIND_DUPLICATES_TOOLTIP = (
+    "Start searching for duplicate files.\nFiles from Priority Folders are marked with a star."
+)
+
+# (widget attribute, setter, text) applied by retranslateUi in one walk
+_UI_TEXTS = (
+    # Buttons
+    ("select_dir_button", "setText", "Add Folder"),
+    ("remove_dir_button", "setText", "Remove Selected"),
+    ("find_duplicates_button", "setText", "Find Duplicates"),
+    ("keep_one_button", "setText", "Keep OnlyOne File Per Group"),
+    ("about_button", "setText", "Help/About"),
+    ("favourite_dirs_button", "setText", "Manage Priority Folders"),
+    ("excluded_dirs_button", "setText", "Manage Excluded Folders"),
+    # Check boxes
+    ("preview_cache_checkbox", "setText", "Cache previews"),
+    # Group box titles
+    ("filters_group", "setTitle", "Filters"),
+    ("favourite_group", "setTitle", "Priority Folders"),
+    ("excluded_group", "setTitle", "Excluded Folders"),
+    # Labels
+    ("label_root_folder", "setText", "Scan Folders:"),
+    ("label_min_size", "setText", "Min size:"),
+    ("label_max_size", "setText", "Max size:"),
+    ("label_extensions", "setText", "Extensions:"),
+    ("label_max_groups", "setText", "Max groups:"),
+    ("boost_label", "setText", "Boost:"),
+    ("mode_label", "setText", "Mode:"),
+    ("ordering_label", "setText", "Order:"),
+)
+
 
 class Ui_MainWindow:
     """Pure UI class following Qt's official pattern (composition, not inheritance)."""
@@ -22,6 +122,8 @@ class Ui_MainWindow:
 
         central_widget = QWidget(MainWindow)
         MainWindow.setCentralWidget(central_widget)
+        # No repaints while the widgets are created and laid out, one update at the end
+        central_widget.setUpdatesEnabled(False)
 
         # Root directory layout (Multiple directories support)
         self.root_layout = QVBoxLayout()
@@ -32,11 +134,9 @@ class Ui_MainWindow:
         self.root_header_layout.addWidget(self.label_root_folder)
         self.root_header_layout.addStretch()
         self.select_dir_button = QPushButton(central_widget)
-        self.select_dir_button.setText("Add Folder")
         self.root_header_layout.addWidget(self.select_dir_button)
 
         self.remove_dir_button = QPushButton(central_widget)
-        self.remove_dir_button.setText("Remove Selected")
         self.remove_dir_button.setToolTip("Remove selected folder from the list")
         self.remove_dir_button.setMaximumWidth(150)
         self.root_header_layout.addWidget(self.remove_dir_button)
@@ -51,150 +151,72 @@ class Ui_MainWindow:
         self.root_layout.addWidget(self.root_dir_list)
 
         # Size filters
-        self.min_size_layout = QHBoxLayout()
         self.label_min_size = QLabel(central_widget)
-        self.min_size_layout.addWidget(self.label_min_size)
         self.min_size_spin, self.min_unit_combo = self.create_size_input(100, central_widget)
-        self.min_size_spin.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        self.min_unit_combo.setCurrentText("KB")
-        self.min_size_layout.addWidget(self.min_size_spin)
-        self.min_size_layout.addWidget(self.min_unit_combo)
 
-        self.max_size_layout = QHBoxLayout()
         self.label_max_size = QLabel(central_widget)
-        self.max_size_layout.addWidget(self.label_max_size)
         self.max_size_spin, self.max_unit_combo = self.create_size_input(100, central_widget)
-        self.max_size_spin.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         self.max_unit_combo.setCurrentText("MB")
-        self.max_size_layout.addWidget(self.max_size_spin)
-        self.max_size_layout.addWidget(self.max_unit_combo)
 
         # Extension filter
-        self.extension_layout_inside = QHBoxLayout()
         self.label_extensions = QLabel(central_widget)
-        self.extension_layout_inside.addWidget(self.label_extensions)
         self.extension_filter_input = QLineEdit(central_widget)
         self.extension_filter_input.setPlaceholderText(".jpg .png .pdf")
-        self.extension_filter_input.setToolTip(
-            "Enter file extensions separated by spaces (e.g., .jpg .png .pdf). "
-            "Leave empty to disable extension filtering. "
-            "Extensions can be with or without leading dot (both .jpg and jpg work)."
-        )
-        self.extension_layout_inside.addWidget(self.extension_filter_input)
+        self.extension_filter_input.setToolTip(_EXTENSIONS_TOOLTIP)
 
         # === Max Groups Limit ===
-        self.max_groups_layout = QHBoxLayout()
         self.label_max_groups = QLabel(central_widget)
-        self.label_max_groups.setText("Max groups:")
-        self.max_groups_layout.addWidget(self.label_max_groups)
-
         self.max_groups_combo = QComboBox(central_widget)
-        self.max_groups_combo.setToolTip(
-            "Limit the number of duplicate groups shown in GUI.\n"
-            "Higher values may slow down the interface.\n"
-            "CLI remains unlimited."
-        )
-        self.max_groups_combo.addItem("100", userData=100)
-        self.max_groups_combo.addItem("300", userData=300)
-        self.max_groups_combo.addItem("600", userData=600)
-        self.max_groups_combo.addItem("1,000", userData=1000)
-        self.max_groups_combo.addItem("3,000 (Default)", userData=3000)
-        self.max_groups_combo.addItem("6,000", userData=6000)
-        self.max_groups_combo.addItem("9,000", userData=9000)
-        self.max_groups_combo.addItem("12,000 (Slow)", userData=12000)
-        self.max_groups_combo.addItem("Unlimit (Not recommended)", userData=None)
+        self.max_groups_combo.setToolTip(_MAX_GROUPS_TOOLTIP)
+        self._fill_combo(self.max_groups_combo, _MAX_GROUPS_CHOICES)
         self.max_groups_combo.setCurrentIndex(4)  # 3000 by default
-        self.max_groups_layout.addWidget(self.max_groups_combo)
 
-        # Filters group
+        # Filters group: one row per entry, laid out in a single pass once all widgets exist
+        self.min_size_layout = self._hbox(self.label_min_size, self.min_size_spin, self.min_unit_combo)
+        self.max_size_layout = self._hbox(self.label_max_size, self.max_size_spin, self.max_unit_combo)
+        self.extension_layout_inside = self._hbox(self.label_extensions, self.extension_filter_input)
+        self.max_groups_layout = self._hbox(self.label_max_groups, self.max_groups_combo)
         self.filters_group = QGroupBox(central_widget)
         filters_group_layout = QVBoxLayout()
-        filters_group_layout.addLayout(self.min_size_layout)
-        filters_group_layout.addLayout(self.max_size_layout)
-        filters_group_layout.addLayout(self.extension_layout_inside)
-        filters_group_layout.addLayout(self.max_groups_layout)
+        for row_layout in (self.min_size_layout, self.max_size_layout,
+                           self.extension_layout_inside, self.max_groups_layout):
+            filters_group_layout.addLayout(row_layout)
         self.filters_group.setLayout(filters_group_layout)
-        self.filters_group.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-
-        # Favourite folders
-        self.favourite_group = QGroupBox(central_widget)
-        self.favourite_dirs_button = QPushButton(central_widget)
-        self.favourite_dirs_button.setToolTip(
-            "Files from these folders are prioritized to keep (goes first, as 'original') in each group."
-        )
-        self.favourite_list_widget = QListWidget(central_widget)
-        self.favourite_list_widget.setContentsMargins(0, 0, 0, 0)
-        self.favourite_list_widget.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
-        self.favourite_list_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.favourite_list_widget.setStyleSheet("padding: 0px; margin: 0px;")
-
-        favourite_layout = QVBoxLayout()
-        favourite_layout.addWidget(self.favourite_dirs_button)
-        favourite_layout.addWidget(self.favourite_list_widget)
-        self.favourite_group.setLayout(favourite_layout)
-        self.favourite_group.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-
-        # Excluded folders
-        self.excluded_group = QGroupBox(central_widget)
-        self.excluded_dirs_button = QPushButton(central_widget)
-        self.excluded_dirs_button.setToolTip(
-            "Files from these folders will be excluded from scanning."
-        )
-        self.excluded_list_widget = QListWidget(central_widget)
-        self.excluded_list_widget.setContentsMargins(0, 0, 0, 0)
-        self.excluded_list_widget.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
-        self.excluded_list_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.excluded_list_widget.setStyleSheet("padding: 0px; margin: 0px;")
-
-        excluded_layout = QVBoxLayout()
-        excluded_layout.addWidget(self.excluded_dirs_button)
-        excluded_layout.addWidget(self.excluded_list_widget)
-        self.excluded_group.setLayout(excluded_layout)
-        self.excluded_group.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.excluded_group.setMaximumHeight(self.filters_group.sizeHint().height() + 20)
+        self.filters_group.setSizePolicy(_FIXED_POLICY)
+
+        # Favourite and excluded folders: same button + list box, built by one helper
+        self.favourite_group, self.favourite_dirs_button, self.favourite_list_widget = \
+            self._folder_list_group(central_widget, _FAVOURITE_DIRS_TOOLTIP)
+        self.excluded_group, self.excluded_dirs_button, self.excluded_list_widget = \
+            self._folder_list_group(central_widget, _EXCLUDED_DIRS_TOOLTIP)
+        # Folder boxes are capped at the filters group height, probed once for both
+        folder_box_height = self.filters_group.sizeHint().height() + 20
+        self.favourite_group.setMaximumHeight(folder_box_height)
+        self.excluded_group.setMaximumHeight(folder_box_height)
 
         # Top-level layout: filters + favourites + excluded side by side
-        level_layout = QHBoxLayout()
-        level_layout.addWidget(self.filters_group)
-        level_layout.addWidget(self.favourite_group)
-        level_layout.addWidget(self.excluded_group)
+        level_layout = self._hbox(self.filters_group, self.favourite_group, self.excluded_group)
         level_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
 
-        # Sync height with filters group
-        MainWindow.updateGeometry()
-        self.favourite_group.setMaximumHeight(self.filters_group.sizeHint().height() + 20)
-
         # Boost Mode Controls
         self.boost_label = QLabel(central_widget)
         self.boost_combo = QComboBox(central_widget)
-        self.boost_combo.setToolTip(
-            "Boost for initial file grouping\n"
-            "Size               = Compare only files of the same size\n"
-            "Size + Extension   = Compare only files of the same size and extension\n"
-            "Size + Filename    = Compare only files of the same size and filename\n"
-            "Size + Fuzzy Filename = Compare only files of the same size and similar filename"
-        )
+        self._fill_combo(self.boost_combo, _BOOST_ITEMS)
+        self.boost_combo.setToolTip(_BOOST_TOOLTIP)
 
         # Control buttons and mode selection
         self.mode_label = QLabel(central_widget)
         self.dedupe_mode_combo = QComboBox(central_widget)
-        self.dedupe_mode_combo.setToolTip(
-            "NORMAL  = Boost + checksums from 3 parts of the file (generally reliable)\n"
-            "FULL    = Boost + checksums from 2 parts + entire file (very slow for large files)"
-        )
+        self._fill_combo(self.dedupe_mode_combo, _DEDUPE_MODE_ITEMS)
+        self.dedupe_mode_combo.setToolTip(_DEDUPE_MODE_TOOLTIP)
 
         self.ordering_label = QLabel(central_widget)
         self.ordering_combo = QComboBox(central_widget)
-        self.ordering_combo.setToolTip(
-            "Which file should be kept/considered as 'original'?\n"
-            "- The file closest to the root folder (shortest path)\n"
-            "- The file with the shortest filename"
-        )
+        self._fill_combo(self.ordering_combo, _ORDERING_ITEMS)
+        self.ordering_combo.setToolTip(_ORDERING_TOOLTIP)
 
         self.find_duplicates_button = QPushButton(central_widget)
-        self.find_duplicates_button.setToolTip(
-            "Start searching for duplicate files.\nFiles from Priority Folders are marked with a star."
-        )
+        self.find_duplicates_button.setToolTip(_FIND_DUPLICATES_TOOLTIP)
 
         self.keep_one_button = QPushButton(central_widget)
         self.keep_one_button.setToolTip("Keep one file (the first) per group and move the rest to trash")
@@ -202,29 +224,35 @@ class Ui_MainWindow:
         self.about_button = QPushButton(central_widget)
         self.about_button.setToolTip("Show Help")
 
-        control_layout = QHBoxLayout()
-        control_layout.addWidget(self.find_duplicates_button)
-        control_layout.addWidget(self.boost_label)
-        control_layout.addWidget(self.boost_combo)
-        control_layout.addWidget(self.mode_label)
-        control_layout.addWidget(self.dedupe_mode_combo)
-        control_layout.addWidget(self.ordering_label)
-        control_layout.addWidget(self.ordering_combo)
-        control_layout.addWidget(self.keep_one_button)
-        control_layout.addWidget(self.about_button)
+        self.preview_cache_checkbox = QCheckBox(central_widget)
+        self.preview_cache_checkbox.setToolTip(self._preview_cache_tooltip())
+
+        control_layout = self._hbox(
+            self.find_duplicates_button,
+            self.boost_label, self.boost_combo,
+            self.mode_label, self.dedupe_mode_combo,
+            self.ordering_label, self.ordering_combo,
+            self.keep_one_button, self.about_button,
+            self.preview_cache_checkbox,
+        )
         control_layout.addStretch()
         control_layout.setContentsMargins(0, 20, 0, 0)
 
-        # Main content area: groups list + image preview
+        # Main content area: groups list + image preview.
+        # The preview is built on first use (see image_preview), a plain label holds its place until then
         self.splitter = QSplitter(Qt.Orientation.Horizontal, central_widget)
         self.groups_list = DuplicateGroupsList()
-        self.image_preview = ImagePreviewLabel()
+        self._image_preview = None
+        self._preview_placeholder = QLabel(_PREVIEW_PLACEHOLDER_TEXT)
+        self._preview_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._preview_placeholder.setWordWrap(True)
+        self._preview_placeholder.setSizePolicy(_IGNORED_POLICY)
         self.splitter.addWidget(self.groups_list)
-        self.splitter.addWidget(self.image_preview)
+        self.splitter.addWidget(self._preview_placeholder)
         self.splitter.setCollapsible(0, False)
         self.splitter.setCollapsible(1, False)
-        self.splitter.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
-        self.groups_list.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        self.splitter.setSizePolicy(_PREFERRED_POLICY)
+        self.groups_list.setSizePolicy(_PREFERRED_POLICY)
 
         # Main layout assembly
         main_layout = QVBoxLayout(central_widget)
@@ -249,68 +277,108 @@ class Ui_MainWindow:
                     }
                 """)
 
+        central_widget.setUpdatesEnabled(True)
+
+    @property
+    def has_image_preview(self) -> bool:
+        """True once the image preview has been built."""
+        return self._image_preview is not None
+
+    @property
+    def image_preview(self) -> ImagePreviewLabel:
+        """Image preview pane, imported, built and swapped in for its placeholder on first access."""
+        if self._image_preview is None:
+            from onlyone.gui.custom_widgets.image_preview_label import ImagePreviewLabel
+            sizes = self.splitter.sizes()
+            self._image_preview = ImagePreviewLabel()
+            self.splitter.replaceWidget(1, self._image_preview)
+            self.splitter.setCollapsible(1, False)
+            self.splitter.setSizes(sizes)
+            self._preview_placeholder.deleteLater()
+            self._preview_placeholder = None
+        return self._image_preview
+
+    @staticmethod
+    def _preview_cache_tooltip() -> str:
+        """Tooltip of the preview cache check box, naming the cache directory and size cap."""
+        return (
+            f"Keep downscaled previews in {PreviewDiskCache().directory} "
+            f"(up to {PreviewDiskCache.MAX_BYTES >> 20} MB),\n"
+            "so previously viewed images show faster in later sessions.\n"
+            "Unchecking deletes the cached previews."
+        )
+
+    @staticmethod
+    def _hbox(*widgets: QWidget) -> QHBoxLayout:
+        """Horizontal layout holding the given widgets, left to right."""
+        layout = QHBoxLayout()
+        for widget in widgets:
+            layout.addWidget(widget)
+        return layout
+
+    @staticmethod
+    def _folder_list_group(parent: QWidget, button_tooltip: str) -> tuple[QGroupBox, QPushButton, QListView]:
+        """
+        Group box holding a "manage folders" button above a read-only folder list.
+        The list is a QListView over a FolderListModel: filled with one set_paths() call,
+        no item object per folder.
+        """
+        group = QGroupBox(parent)
+        button = QPushButton(parent)
+        button.setToolTip(button_tooltip)
+        list_view = QListView(parent)
+        list_view.setModel(FolderListModel(list_view))
+        list_view.setContentsMargins(0, 0, 0, 0)
+        list_view.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
+        list_view.setSizePolicy(_EXPANDING_FIXED_POLICY)
+        list_view.setStyleSheet("padding: 0px; margin: 0px;")
+
+        layout = QVBoxLayout()
+        layout.addWidget(button)
+        layout.addWidget(list_view)
+        group.setLayout(layout)
+        group.setSizePolicy(_EXPANDING_FIXED_POLICY)
+        return group, button, list_view
+
     @staticmethod
     def create_size_input(default_value: int = 100, parent: QWidget | None = None) -> tuple[QSpinBox, QComboBox]:
         spin = QSpinBox(parent)
-        spin.setRange(0, 1024 * 1024)
+        spin.setRange(0, 1 << 20)
         spin.setValue(default_value)
+        # valueChanged fires once per committed edit (Enter / focus out / arrows), not per typed digit
+        spin.setKeyboardTracking(False)
+        spin.setSizePolicy(_FIXED_POLICY)
         unit_combo = QComboBox(parent)
-        unit_combo.addItems(["KB", "MB", "GB"])
+        with QSignalBlocker(unit_combo):
+            unit_combo.addItems(_SIZE_UNITS)  # first unit (KB) is current
         return spin, unit_combo
 
     def retranslateUi(self, MainWindow: QMainWindow):
-        """Apply all UI texts - single source of truth for strings."""
+        """Apply all UI texts - single source of truth for strings (setupUi sets none of them)."""
         MainWindow.setWindowTitle("OnlyOne")
 
-        # Buttons and input fields
-        self.select_dir_button.setText("Add Folder")
-        self.remove_dir_button.setText("Remove Selected")
-        self.find_duplicates_button.setText("Find Duplicates")
-        self.keep_one_button.setText("Keep OnlyOne File Per Group")
-        self.about_button.setText("Help/About")
-        self.favourite_dirs_button.setText("Manage Priority Folders")
-        self.excluded_dirs_button.setText("Manage Excluded Folders")
-
-        # Group box titles
-        self.filters_group.setTitle("Filters")
-        self.favourite_group.setTitle("Priority Folders")
-        self.excluded_group.setTitle("Excluded Folders")
-
-        # Labels
-        self.label_root_folder.setText("Scan Folders:")
-        self.label_min_size.setText("Min size:")
-        self.label_max_size.setText("Max size:")
-        self.label_extensions.setText("Extensions:")
-        self.boost_label.setText("Boost:")
-        self.mode_label.setText("Mode:")
-        self.ordering_label.setText("Order:")
-
-        # Boost Mode Combo
-        current_boost_index = self.boost_combo.currentIndex()
-        self.boost_combo.clear()
-
-        for mode in BoostMode:
-            self.boost_combo.addItem(mode.display_name, userData=mode)
-
-        if 0 <= current_boost_index < self.boost_combo.count():
-            self.boost_combo.setCurrentIndex(current_boost_index)
-
-        # Deduplication Mode Combo
-        current_mode_index = self.dedupe_mode_combo.currentIndex()
-        self.dedupe_mode_combo.clear()
-
-        for mode in DeduplicationMode:
-            self.dedupe_mode_combo.addItem(mode.display_name, userData=mode)
-
-        if 0 <= current_mode_index < self.dedupe_mode_combo.count():
-            self.dedupe_mode_combo.setCurrentIndex(current_mode_index)
-
-        # Ordering Combo
-        current_order_index = self.ordering_combo.currentIndex()
-        self.ordering_combo.clear()
-
-        for sort_order in SortOrder:
-            self.ordering_combo.addItem(sort_order.display_name, userData=sort_order)
-
-        if 0 <= current_order_index < self.ordering_combo.count():
-            self.ordering_combo.setCurrentIndex(current_order_index)
\ No newline at end of file
+        for widget_name, setter, text in _UI_TEXTS:
+            getattr(getattr(self, widget_name), setter)(text)
+
+        # Enum combos: items and userData are created once in setupUi,
+        # only their texts are refreshed here (no clear(), no index signals)
+        self._retranslate_enum_combo(self.boost_combo, _BOOST_ITEMS)
+        self._retranslate_enum_combo(self.dedupe_mode_combo, _DEDUPE_MODE_ITEMS)
+        self._retranslate_enum_combo(self.ordering_combo, _ORDERING_ITEMS)
+
+    @staticmethod
+    def _fill_combo(combo: QComboBox, items) -> None:
+        """Fill a combo with (text, userData) items in one batch, without per-item change signals."""
+        with QSignalBlocker(combo):
+            combo.insertItems(0, [text for text, _ in items])
+            set_item_data, user_role = combo.setItemData, Qt.ItemDataRole.UserRole
+            for i, (_, data) in enumerate(items):
+                set_item_data(i, data, user_role)
+
+    @staticmethod
+    def _retranslate_enum_combo(combo: QComboBox, items):
+        """Refresh item texts of a combo filled by _fill_combo with the same items."""
+        with QSignalBlocker(combo):
+            set_item_text = combo.setItemText
+            for i, (text, _) in enumerate(items):
+                set_item_text(i, text)
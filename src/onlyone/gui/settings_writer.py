@@ -0,0 +1,35 @@
+"""
+Qt worker runnable that commits settings to the QSettings backend in the thread pool.
+Keeps the GUI thread from blocking on registry/INI flushes (sync()).
+"""
+from typing import Any, Dict
+from PySide6.QtCore import QRunnable, QSettings
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SettingsWriter(QRunnable):
+    """
+    Worker that writes a batch of settings and syncs them once.
+
+    Uses its own QSettings object: QSettings instances are reentrant but not
+    thread-safe, while instances with the same organization/application share
+    the same backing store, so the GUI thread sees the values after sync().
+    """
+    def __init__(self, values: Dict[str, Any], organization: str, application: str):
+        super().__init__()
+        self.values = dict(values)
+        self.organization = organization
+        self.application = application
+        self.setAutoDelete(True)
+
+    def run(self):
+        """Write all values and sync. Runs in thread pool thread."""
+        try:
+            settings = QSettings(self.organization, self.application)
+            for key, value in self.values.items():
+                settings.setValue(key, value)
+            settings.sync()
+        except Exception as e:
+            logger.exception(f"SettingsWriter failed: {e}")
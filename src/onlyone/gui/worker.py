@@ -2,7 +2,7 @@
 Qt worker runnable — follows modern Qt pattern: QRunnable + QThreadPool.
 Accepts DeduplicationParams for unified configuration.
 """
-from PySide6.QtCore import QRunnable, QObject, Signal, QMutex, QMutexLocker
+from PySide6.QtCore import QRunnable, QObject, Signal, QMutex, QMutexLocker, QElapsedTimer
 from onlyone.core.models import DeduplicationParams
 from onlyone.commands import DeduplicationCommand
 import logging
@@ -12,7 +12,7 @@ logger = logging.getLogger(__name__)
 class WorkerSignals(QObject):
     """Separate QObject to hold signals (QRunnable cannot emit signals directly)."""
     progress = Signal(str, int, object)  # stage, current, total
-    finished = Signal(list, object)      # duplicate_groups, stats
+    finished = Signal(object, object)    # duplicate_groups, stats
     error = Signal(str)
 
 
@@ -20,7 +20,12 @@ class DeduplicateWorker(QRunnable):
     """
     Worker runnable that performs deduplication in thread pool.
     Automatically deleted after execution (setAutoDelete=True).
+
+    Progress is emitted at most every PROGRESS_INTERVAL_MS within a stage;
+    stage changes and final (current >= total) updates are always emitted.
     """
+    PROGRESS_INTERVAL_MS = 33
+
     def __init__(self, params: DeduplicationParams):
         super().__init__()
         self.params = params
@@ -28,6 +33,10 @@ class DeduplicateWorker(QRunnable):
         self.signals = WorkerSignals()
         self._stopped = False
         self._mutex = QMutex()
+        self._progress_timer = QElapsedTimer()
+        self._progress_timer.start()
+        self._last_emit_ms = -self.PROGRESS_INTERVAL_MS
+        self._last_emit_stage = None
         self.setAutoDelete(True)  # Critical: auto-delete after run() completes
 
     def stop(self):
@@ -41,9 +50,16 @@ class DeduplicateWorker(QRunnable):
             return self._stopped
 
     def safe_progress_emit(self, stage: str, current: int, total=None):
-        """Emits progress signal safely with mutex protection."""
+        """Emits progress signal safely with mutex protection (throttled, see class docstring)."""
         with QMutexLocker(self._mutex):
             if not self._stopped:
+                now_ms = self._progress_timer.elapsed()
+                is_final = total is not None and current >= total
+                if (stage == self._last_emit_stage and not is_final
+                        and now_ms - self._last_emit_ms < self.PROGRESS_INTERVAL_MS):
+                    return
+                self._last_emit_ms = now_ms
+                self._last_emit_stage = stage
                 try:
                     self.signals.progress.emit(stage, current, total)
                 except RuntimeError:
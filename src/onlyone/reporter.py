@@ -6,7 +6,7 @@ reporter.py
 Formatting helpers for CLI output. Returns strings; cli.py handles printing.
 """
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from onlyone.core.models import DuplicateGroup, DeduplicationStats
 from onlyone.core.measurer import bytes_to_human
 
@@ -40,23 +40,32 @@ def format_groups_output(
     if not groups:
         return "No duplicate groups found."
 
-    lines = []
+    return "\n".join(iter_groups_output(groups, show_fav_marker, ascii_only, stats))
+
+def iter_groups_output(
+        groups: List[DuplicateGroup],
+        show_fav_marker: bool = False,
+        ascii_only: bool = False,
+        stats: Optional[DeduplicationStats] = None
+) -> Iterator[str]:
+    """
+    Yield the lines of format_groups_output() one at a time.
+    Lets large results be written out as they are formatted, without one big string.
+    """
     total_files = sum(len(g.files) for g in groups)
 
     if stats and stats.groups_truncated:
         icons = _get_icons(ascii_only)
         print()
-        lines.append(f"{icons['warning']}\nResults limited to {len(groups)} groups (showing largest first)")
-        lines.append(f"Total groups found: {stats.total_groups_found}")
-        lines.append(f"Use --max-groups with higher value for full results")
-        lines.append("")
+        yield f"{icons['warning']}\nResults limited to {len(groups)} groups (showing largest first)"
+        yield f"Total groups found: {stats.total_groups_found}"
+        yield f"Use --max-groups with higher value for full results"
+        yield ""
     else:
-        lines.append(f"Found {len(groups)} duplicate groups ({total_files} files)")
+        yield f"Found {len(groups)} duplicate groups ({total_files} files)"
 
     for idx, group in enumerate(groups, 1):
-        lines.extend(format_group(group, idx, show_fav_marker, ascii_only))
-
-    return "\n".join(lines)
+        yield from format_group(group, idx, show_fav_marker, ascii_only)
 
 def format_group(group: DuplicateGroup, idx: int, show_fav_marker: bool = True, ascii_only: bool = False) -> List[str]:
     """Format a single duplicate group. Returns list of lines."""
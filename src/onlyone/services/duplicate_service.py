@@ -1,42 +1,100 @@
-from typing import List, Tuple
+from typing import Dict, Iterable, List, Tuple
 from onlyone.core.models import DuplicateGroup, File
 
 class DuplicateService:
     @staticmethod
-    def remove_files_from_groups(groups: List[DuplicateGroup], file_paths: List[str]) -> List[DuplicateGroup]:
+    def remove_files_from_groups(groups: List[DuplicateGroup], file_paths: Iterable[str]) -> List[DuplicateGroup]:
         """
         Removes files with the specified paths from all duplicate groups.
 
         Files that match any of the provided file paths are removed from each group.
         Groups that contain fewer than 2 files after removal are discarded.
+        Groups without removed files are reused as is; only changed groups are rebuilt.
 
         Args:
             groups (list[DuplicateGroup]): List of duplicate groups to update.
-            file_paths (list[str]): List of file paths to remove.
+            file_paths (Iterable[str]): File paths to remove.
 
         Returns:
             list[DuplicateGroup]: Updated list of duplicate groups.
         """
+        deleted = file_paths if isinstance(file_paths, (set, frozenset)) else set(file_paths)
         updated_groups = []
         for group in groups:
-            filtered_files = [f for f in group.files if f.path not in file_paths]
+            filtered_files = [f for f in group.files if f.path not in deleted]
             if len(filtered_files) >= 2:
-                updated_groups.append(DuplicateGroup(size=group.size, files=filtered_files))
+                unchanged = len(filtered_files) == len(group.files)
+                updated_groups.append(group if unchanged else DuplicateGroup(size=group.size, files=filtered_files))
         return updated_groups
 
     @staticmethod
-    def remove_files_from_file_list(files: List[File], file_paths: List[str]) -> List[File]:
+    def remove_files_from_file_list(files: List[File], file_paths: Iterable[str]) -> List[File]:
         """
         Removes files matching the given file paths from the main file list.
 
         Args:
             files (list[File]): The full list of files found during scanning.
-            file_paths (list[str]): Paths of files to be removed.
+            file_paths (Iterable[str]): Paths of files to be removed.
 
         Returns:
             list[File]: A new list of files excluding those marked for deletion.
         """
-        return [f for f in files if f.path not in file_paths]
+        deleted = file_paths if isinstance(file_paths, (set, frozenset)) else set(file_paths)
+        return [f for f in files if f.path not in deleted]
+
+    @staticmethod
+    def build_path_index(groups: List[DuplicateGroup]) -> Dict[str, DuplicateGroup]:
+        """
+        Builds a path -> group index for use with remove_files_using_index().
+
+        Args:
+            groups (list[DuplicateGroup]): Duplicate groups to index.
+
+        Returns:
+            dict[str, DuplicateGroup]: Maps each file path to the group containing it.
+        """
+        return {f.path: group for group in groups for f in group.files}
+
+    @staticmethod
+    def remove_files_using_index(
+            groups: List[DuplicateGroup],
+            path_index: Dict[str, DuplicateGroup],
+            file_paths: Iterable[str]
+    ) -> List[DuplicateGroup]:
+        """
+        Removes files from duplicate groups by looking them up in a path index.
+
+        Only the groups that contain removed files are touched, so the cost depends on
+        the number of removed files rather than on the total number of files.
+        Touched groups are updated in place and the index is kept in sync.
+        Groups that contain fewer than 2 files after removal are discarded.
+
+        Args:
+            groups (list[DuplicateGroup]): Duplicate groups the index was built from.
+            path_index (dict[str, DuplicateGroup]): Index from build_path_index().
+            file_paths (Iterable[str]): File paths to remove.
+
+        Returns:
+            list[DuplicateGroup]: Updated list of duplicate groups
+            (the same list object if no group was discarded).
+        """
+        removed_by_group: Dict[int, Tuple[DuplicateGroup, set]] = {}
+        for path in file_paths:
+            group = path_index.pop(path, None)
+            if group is not None:
+                removed_by_group.setdefault(id(group), (group, set()))[1].add(path)
+
+        discarded = set()
+        for group_id, (group, removed) in removed_by_group.items():
+            group.files = [f for f in group.files if f.path not in removed]
+            if len(group.files) < 2:
+                discarded.add(group_id)
+                for f in group.files:
+                    path_index.pop(f.path, None)
+
+        if not discarded:
+            return groups
+        return [g for g in groups if id(g) not in discarded]
 
     @staticmethod
     def update_favourite_status(files: List[File], favourite_dirs: List[str]):
@@ -52,8 +110,34 @@ class DuplicateService:
         """
         if not files:
             return
+        prefixes = File.favourite_dir_prefixes(favourite_dirs)
         for file in files:
-            file.set_favourite_status(favourite_dirs)
+            file.set_favourite_status_by_prefixes(prefixes)
+
+    @staticmethod
+    def update_favourite_status_in_groups(groups: List[DuplicateGroup], favourite_dirs: List[str]) -> None:
+        """
+        Updates the `is_from_fav_dir` flag on every file in the groups and moves
+        favourite files to the front of their group.
+
+        Flags are set and each group is partitioned in the same pass. The partition is
+        stable, so the existing order is kept within favourite and non-favourite files.
+
+        Args:
+            groups (List[DuplicateGroup]): Duplicate groups to update in place.
+            favourite_dirs (List[str]): List of favourite directory paths.
+        """
+        prefixes = File.favourite_dir_prefixes(favourite_dirs)
+        for group in groups:
+            favourites = []
+            others = []
+            for file in group.files:
+                file.set_favourite_status_by_prefixes(prefixes)
+                if file.is_from_fav_dir:
+                    favourites.append(file)
+                else:
+                    others.append(file)
+            group.files = favourites + others
 
     @staticmethod
     def keep_only_one_file_per_group(groups: List[DuplicateGroup]) -> Tuple[List[str], List[DuplicateGroup]]:
@@ -63,15 +147,10 @@ class DuplicateService:
             - List of file paths to be deleted
             - Updated list of duplicate groups
         """
-        files_to_delete = []
-
         # Collect file paths that need to be deleted
-        for group in groups:
-            if len(group.files) > 1:
-                for file in group.files[1:]:
-                    files_to_delete.append(file.path)
+        files_to_delete = [file.path for group in groups for file in group.files[1:]]
 
-        # Remove them from all groups
-        updated_groups = DuplicateService.remove_files_from_groups(groups, files_to_delete)
+        # Remove them from all groups (set built here once, shared by every group)
+        updated_groups = DuplicateService.remove_files_from_groups(groups, set(files_to_delete))
 
         return files_to_delete, updated_groups
\ No newline at end of file
@@ -10,7 +10,7 @@ import os
 import sys
 import subprocess
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 from send2trash import send2trash
 
 # Optional import Pillow
@@ -27,6 +27,8 @@ class FileService:
     Cross-platform file operations for frozen applications.
     Uses universal system tools with proper error handling.
     """
+    # Paths handed to a single send2trash() call (one shell file operation on Windows)
+    TRASH_BATCH_SIZE = 200
 
     @staticmethod
     def open_file(file_path: str):
@@ -114,15 +116,50 @@ class FileService:
         except Exception as e:
             raise RuntimeError(f"Failed to move to trash: {e}") from e
 
+    @classmethod
+    def move_batch_to_trash(cls, file_paths: List[str]) -> List[Tuple[str, str]]:
+        """
+        Moves a batch of files to trash with a single send2trash() call.
+
+        If the batch call fails, files that are still present are retried one by one,
+        so each failure is reported for its own path.
+        Returns a list of (path, error message) tuples for files that were not moved.
+        """
+        failed = []
+        existing = []
+        for file_path in file_paths:
+            try:
+                path = Path(file_path).resolve()
+                exists = path.exists()
+            except (OSError, RuntimeError) as e:  # e.g. a symlink loop
+                failed.append((file_path, f"Failed to move to trash: {e}"))
+                continue
+            if exists:
+                existing.append((file_path, str(path)))
+            else:
+                failed.append((file_path, f"Failed to move to trash: File not found: {path}"))
+
+        if not existing:
+            return failed
+
+        try:
+            send2trash([resolved for _, resolved in existing])
+        except Exception:
+            for file_path, resolved in existing:
+                if not os.path.lexists(resolved):
+                    continue  # Already trashed before the batch failed
+                try:
+                    cls.move_to_trash(file_path)
+                except Exception as e:
+                    failed.append((file_path, str(e)))
+        return failed
+
     @classmethod
     def move_multiple_to_trash(cls, file_paths: List[str]):
-        """Moves multiple files to trash with error aggregation."""
+        """Moves multiple files to trash in batches with error aggregation."""
         errors = []
-        for path in file_paths:
-            try:
-                cls.move_to_trash(path)
-            except Exception as e:
-                errors.append((path, str(e)))
+        for start in range(0, len(file_paths), cls.TRASH_BATCH_SIZE):
+            errors.extend(cls.move_batch_to_trash(file_paths[start:start + cls.TRASH_BATCH_SIZE]))
 
         if errors:
             error_summary = "\n".join(
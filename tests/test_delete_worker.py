@@ -0,0 +1,63 @@
+"""
+Unit tests for DeleteWorker — background trash-move runnable.
+Verifies per-file error handling, cancellation and signal emission.
+"""
+
+from unittest.mock import Mock, patch
+from onlyone.gui.delete_worker import DeleteWorker
+
+
+class TestDeleteWorker:
+    """Test worker deletion loop and signal emission."""
+
+    def test_run_reports_deleted_and_failed_files(self):
+        """A failing file must not stop the others; both lists are reported."""
+        worker = DeleteWorker(["/a.txt", "/b.txt", "/c.txt"])
+        finished_handler = Mock()
+        worker.signals.finished.connect(finished_handler)
+
+        with patch("onlyone.gui.delete_worker.FileService.move_batch_to_trash",
+                   return_value=[("/b.txt", "Failed to move to trash: denied")]) as move:
+            worker.run()
+
+        move.assert_called_once_with(["/a.txt", "/b.txt", "/c.txt"])
+        assert finished_handler.call_count == 1
+        deleted, failed, was_stopped = finished_handler.call_args[0]
+        assert deleted == ["/a.txt", "/c.txt"]
+        assert [path for path, _ in failed] == ["/b.txt"]
+        assert was_stopped is False
+
+    def test_stop_skips_remaining_batches_but_still_finishes(self):
+        """After stop(), no more batches are moved and finished reports what was done."""
+        worker = DeleteWorker(["/a.txt", "/b.txt", "/c.txt"])
+        finished_handler = Mock()
+        worker.signals.finished.connect(finished_handler)
+
+        def move_then_stop(_batch):
+            worker.stop()
+            return []
+
+        with patch("onlyone.gui.delete_worker.FileService.TRASH_BATCH_SIZE", 2), \
+                patch("onlyone.gui.delete_worker.FileService.move_batch_to_trash",
+                      side_effect=move_then_stop) as move:
+            worker.run()
+
+        assert move.call_count == 1
+        deleted, failed, was_stopped = finished_handler.call_args[0]
+        assert deleted == ["/a.txt", "/b.txt"]
+        assert failed == []
+        assert was_stopped is True
+
+    def test_progress_is_throttled(self):
+        """Progress is emitted for the first batch, not for every batch of a fast run."""
+        paths = [f"/file{i}.txt" for i in range(200)]
+        worker = DeleteWorker(paths)
+        progress_handler = Mock()
+        worker.signals.progress.connect(progress_handler)
+
+        with patch("onlyone.gui.delete_worker.FileService.TRASH_BATCH_SIZE", 1), \
+                patch("onlyone.gui.delete_worker.FileService.move_batch_to_trash", return_value=[]):
+            worker.run()
+
+        assert 1 <= progress_handler.call_count < len(paths)
+        assert progress_handler.call_args_list[0][0] == (1, "/file0.txt")
@@ -0,0 +1,85 @@
+"""
+Unit tests for DuplicateGroupsModel — flat list model behind the groups view.
+"""
+
+from PySide6.QtCore import Qt
+from onlyone.core.models import File, DuplicateGroup
+from onlyone.services.duplicate_service import DuplicateService
+from onlyone.gui.custom_widgets.duplicate_groups_list import DuplicateGroupsModel
+
+
+class TestDuplicateGroupsModel:
+    """Test row layout, KEEP/DEL markers and item flags."""
+
+    def _groups(self):
+        return [
+            DuplicateGroup(size=10, files=[File("/fav/2.jpg", 10, is_from_fav_dir=True), File("/a/1.jpg", 10)]),
+            DuplicateGroup(size=20, files=[File("/a/3.jpg", 20), File("/a/4.jpg", 20), File("/a/5.jpg", 20)]),
+        ]
+
+    def test_rows_are_header_files_spacer_per_group(self):
+        """Each group contributes a header, its files and one empty spacer row."""
+        model = DuplicateGroupsModel()
+        model.set_groups(self._groups())
+
+        texts = [model.index(row).data() for row in range(model.rowCount())]
+        assert model.rowCount() == 9
+        assert texts[0].startswith("📁 Group 1")
+        assert texts[1] == "     2.jpg ✅ [KEEP]"
+        assert texts[2] == "     1.jpg [DEL #1]"
+        assert texts[3] == ""
+        assert texts[5] == "     3.jpg [KEEP]"
+        assert texts[7] == "     5.jpg [DEL #3]"
+
+    def test_only_file_rows_are_selectable_and_carry_files(self):
+        """Headers and spacers are inert; file rows expose the File via UserRole."""
+        model = DuplicateGroupsModel()
+        model.set_groups(self._groups())
+
+        header, file_row, spacer = model.index(0), model.index(2), model.index(3)
+        assert model.flags(header) == Qt.ItemFlag.NoItemFlags
+        assert model.flags(spacer) == Qt.ItemFlag.NoItemFlags
+        assert model.flags(file_row) & Qt.ItemFlag.ItemIsSelectable
+        assert file_row.data(Qt.ItemDataRole.UserRole).path == "/a/1.jpg"
+        assert file_row.data(Qt.ItemDataRole.ToolTipRole) == "Path: /a/1.jpg"
+        assert header.data(Qt.ItemDataRole.UserRole) is None
+
+    def test_remove_files_matches_rebuild(self):
+        """Removing rows in place leaves the same rows a full rebuild would produce."""
+        groups = self._groups()
+        model = DuplicateGroupsModel()
+        model.set_groups(groups)
+
+        # Drop the KEEP file of group 2 and discard group 1 entirely
+        deleted = {"/fav/2.jpg", "/a/3.jpg"}
+        groups[1].files = groups[1].files[1:]
+        remaining = [groups[1]]
+
+        assert model.remove_files(deleted, remaining) is True
+        texts = [model.index(row).data() for row in range(model.rowCount())]
+        rebuilt = DuplicateGroupsModel()
+        rebuilt.set_groups(remaining)
+        assert texts == [rebuilt.index(row).data() for row in range(rebuilt.rowCount())]
+        assert texts[1] == "     4.jpg [KEEP]"
+        assert texts[2] == "     5.jpg [DEL #1]"
+
+    def test_remove_files_with_rebuilt_groups(self):
+        """Groups rebuilt by remove_files_from_groups (new objects) keep their remaining rows."""
+        groups = [
+            DuplicateGroup(size=10, files=[File("/a/1.jpg", 10), File("/a/2.jpg", 10), File("/a/3.jpg", 10)]),
+            DuplicateGroup(size=20, files=[File("/b/1.jpg", 20), File("/b/2.jpg", 20), File("/b/3.jpg", 20)]),
+        ]
+        model = DuplicateGroupsModel()
+        model.set_groups(groups)
+
+        deleted = {"/a/2.jpg", "/b/1.jpg"}
+        remaining = DuplicateService.remove_files_from_groups(groups, deleted)
+        assert all(new is not old for new, old in zip(remaining, groups))
+
+        assert model.remove_files(deleted, remaining) is True
+        texts = [model.index(row).data() for row in range(model.rowCount())]
+        rebuilt = DuplicateGroupsModel()
+        rebuilt.set_groups(remaining)
+        assert model.rowCount() == 8
+        assert texts == [rebuilt.index(row).data() for row in range(rebuilt.rowCount())]
+        assert model.index(5).data(Qt.ItemDataRole.UserRole) is remaining[1].files[0]
@@ -147,6 +147,7 @@ class TestRemoveFilesFromGroups:
         assert len(updated_groups[0].files) == 2
         paths = {f.path for f in updated_groups[0].files}
         assert paths == {"/a.jpg", "/b.jpg"}
+        assert updated_groups[0] is group  # Untouched groups are reused, not copied
 
 
 class TestRemoveFilesFromFileList:
@@ -176,6 +177,62 @@ class TestRemoveFilesFromFileList:
         assert len(remaining) == 1
         assert remaining[0].path == "/a.jpg"
 
+    def test_accepts_set_and_generator_of_paths(self):
+        """Paths may be passed as any iterable, including a one-shot generator."""
+        files = [
+            File(path="/a.jpg", size=100, is_from_fav_dir=False),
+            File(path="/b.jpg", size=100, is_from_fav_dir=False),
+        ]
+        assert [f.path for f in DuplicateService.remove_files_from_file_list(files, {"/a.jpg"})] == ["/b.jpg"]
+        remaining = DuplicateService.remove_files_from_file_list(files, (p for p in ["/b.jpg"]))
+        assert [f.path for f in remaining] == ["/a.jpg"]
+
+
+class TestRemoveFilesUsingIndex:
+    """Test index-based removal of files from duplicate groups."""
+
+    def _groups(self):
+        return [
+            DuplicateGroup(size=100, files=[
+                File(path="/a.jpg", size=100),
+                File(path="/b.jpg", size=100),
+            ]),
+            DuplicateGroup(size=200, files=[
+                File(path="/c.jpg", size=200),
+                File(path="/d.jpg", size=200),
+                File(path="/e.jpg", size=200),
+            ]),
+        ]
+
+    def test_removes_files_and_discards_small_groups(self):
+        groups = self._groups()
+        index = DuplicateService.build_path_index(groups)
+
+        updated = DuplicateService.remove_files_using_index(groups, index, ["/b.jpg", "/e.jpg"])
+
+        assert len(updated) == 1
+        assert [f.path for f in updated[0].files] == ["/c.jpg", "/d.jpg"]
+        # Index no longer references removed files or files of discarded groups
+        assert set(index) == {"/c.jpg", "/d.jpg"}
+
+    def test_matches_scan_based_removal(self):
+        paths = ["/a.jpg", "/d.jpg", "/missing.jpg"]
+        expected = DuplicateService.remove_files_from_groups(self._groups(), paths)
+
+        groups = self._groups()
+        index = DuplicateService.build_path_index(groups)
+        updated = DuplicateService.remove_files_using_index(groups, index, paths)
+
+        assert [[f.path for f in g.files] for g in updated] == [[f.path for f in g.files] for g in expected]
+
+    def test_returns_same_list_when_no_group_discarded(self):
+        groups = self._groups()
+        index = DuplicateService.build_path_index(groups)
+
+        updated = DuplicateService.remove_files_using_index(groups, index, ["/missing.jpg"])
+
+        assert updated is groups
+
 
 class TestUpdateFavouriteStatus:
     """Test updating favourite status for files based on directories."""
@@ -209,4 +266,41 @@ class TestUpdateFavouriteStatus:
     def test_handles_empty_favourite_list(self):
         files = [File(path="/a.jpg", size=100, is_from_fav_dir=True)]
         DuplicateService.update_favourite_status(files, [])
-        assert files[0].is_from_fav_dir is False  # Reset to False when no favourites specified
\ No newline at end of file
+        assert files[0].is_from_fav_dir is False  # Reset to False when no favourites specified
+
+    def test_sibling_with_common_prefix_is_not_favourite(self):
+        files = [
+            File(path="/fav", size=100),
+            File(path="/fav/a.jpg", size=100),
+            File(path="/favourites/b.jpg", size=100),
+        ]
+        DuplicateService.update_favourite_status(files, ["/fav/"])
+        assert [f.is_from_fav_dir for f in files] == [True, True, False]
+
+
+class TestUpdateFavouriteStatusInGroups:
+    """Test favourite flag update combined with favourite-first partitioning."""
+
+    def test_moves_favourites_to_front_preserving_order(self):
+        group = DuplicateGroup(size=100, files=[
+            File(path="/other/a.jpg", size=100),
+            File(path="/fav/b.jpg", size=100),
+            File(path="/other/c.jpg", size=100),
+            File(path="/fav/d.jpg", size=100),
+        ])
+
+        DuplicateService.update_favourite_status_in_groups([group], ["/fav"])
+
+        assert [f.path for f in group.files] == ["/fav/b.jpg", "/fav/d.jpg", "/other/a.jpg", "/other/c.jpg"]
+        assert [f.is_from_fav_dir for f in group.files] == [True, True, False, False]
+
+    def test_clears_flag_when_folder_no_longer_favourite(self):
+        group = DuplicateGroup(size=100, files=[
+            File(path="/fav/a.jpg", size=100, is_from_fav_dir=True),
+            File(path="/other/b.jpg", size=100),
+        ])
+
+        DuplicateService.update_favourite_status_in_groups([group], [])
+
+        assert all(not f.is_from_fav_dir for f in group.files)
+        assert [f.path for f in group.files] == ["/fav/a.jpg", "/other/b.jpg"]
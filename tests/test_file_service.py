@@ -6,6 +6,7 @@ import os
 import sys
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 from onlyone.services.file_service import FileService
 
 
@@ -260,6 +261,56 @@ class TestMoveMultipleToTrash:
         FileService.move_multiple_to_trash([])
         # No exception should be raised
 
+    def test_batch_is_sent_in_one_call(self, tmp_path):
+        """Existing files of a batch are handed to send2trash together."""
+        files = [tmp_path / f"file{i}.txt" for i in range(3)]
+        for f in files:
+            f.write_text("content")
+
+        with patch("onlyone.services.file_service.send2trash") as mock_send:
+            failed = FileService.move_batch_to_trash([str(f) for f in files])
+
+        assert failed == []
+        mock_send.assert_called_once_with([str(f.resolve()) for f in files])
+
+    def test_failed_batch_falls_back_to_single_files(self, tmp_path):
+        """If the batch call fails, remaining files are retried one by one."""
+        good = tmp_path / "good.txt"
+        bad = tmp_path / "bad.txt"
+        good.write_text("content")
+        bad.write_text("content")
+
+        def fake_send2trash(paths):
+            if isinstance(paths, list) or paths.endswith("bad.txt"):
+                raise OSError("denied")
+            os.remove(paths)
+
+        with patch("onlyone.services.file_service.send2trash", side_effect=fake_send2trash):
+            failed = FileService.move_batch_to_trash([str(good), str(bad)])
+
+        assert not good.exists()
+        assert [p for p, _ in failed] == [str(bad)]
+
+    def test_unresolvable_path_fails_alone(self, tmp_path):
+        """A path that cannot be resolved is reported; the rest of the batch is still moved."""
+        good = tmp_path / "good.txt"
+        good.write_text("content")
+        bad = tmp_path / "loop.txt"
+        real_resolve = Path.resolve
+
+        def fake_resolve(path, *args, **kwargs):
+            if path.name == "loop.txt":
+                raise RuntimeError("Symlink loop")
+            return real_resolve(path, *args, **kwargs)
+
+        with patch.object(Path, "resolve", fake_resolve), \
+                patch("onlyone.services.file_service.send2trash") as mock_send:
+            failed = FileService.move_batch_to_trash([str(bad), str(good)])
+
+        mock_send.assert_called_once_with([str(good.resolve())])
+        assert [p for p, _ in failed] == [str(bad)]
+        assert "Symlink loop" in failed[0][1]
+
     def test_single_file_deletion_via_batch(self, tmp_path):
         """Batch method should work correctly for single file (edge case)."""
         file = tmp_path / "single.txt"
@@ -0,0 +1,30 @@
+"""
+Unit tests for FolderListModel — read-only model behind the folder lists.
+"""
+
+from PySide6.QtCore import Qt
+from onlyone.gui.custom_widgets.folder_list_model import FolderListModel
+
+
+class TestFolderListModel:
+    """Test path rows, tooltips and item flags."""
+
+    def test_set_paths_replaces_rows(self):
+        """set_paths() replaces all rows; each path is shown and used as its tooltip."""
+        model = FolderListModel()
+        model.set_paths(["/a", "/b"])
+        model.set_paths(["/photos/2024", "/music"])
+
+        assert model.rowCount() == 2
+        assert model.paths() == ["/photos/2024", "/music"]
+        assert model.index(0).data() == "/photos/2024"
+        assert model.index(0).data(Qt.ItemDataRole.ToolTipRole) == "/photos/2024"
+
+    def test_rows_are_selectable_but_not_editable(self):
+        """Folder rows can be selected but not edited in place."""
+        model = FolderListModel()
+        model.set_paths(["/a"])
+
+        flags = model.flags(model.index(0))
+        assert flags & Qt.ItemFlag.ItemIsSelectable
+        assert not flags & Qt.ItemFlag.ItemIsEditable
@@ -139,6 +139,19 @@ class TestHumanToBytes:
         assert human_to_bytes("1K") == 1024
         assert human_to_bytes("1KB") == 1024
 
+    def test_results_are_memoized(self):
+        """Repeated parsing of the same string is served from the cache."""
+        human_to_bytes.cache_clear()
+        assert human_to_bytes("100KB") == 102400
+        assert human_to_bytes("100KB") == 102400
+        assert human_to_bytes.cache_info().hits == 1
+
+    def test_errors_are_not_cached(self):
+        """Invalid input must raise on every call, not only the first."""
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                human_to_bytes("abc")
+
 
 class TestIsValidSizeFormat:
     """Tests for the is_valid_size_format validation helper."""
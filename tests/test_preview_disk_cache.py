@@ -0,0 +1,54 @@
+"""
+Unit tests for PreviewDiskCache — persistent cache of downscaled previews.
+"""
+
+import os
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QImage, QColor
+from onlyone.gui.custom_widgets.preview_disk_cache import PreviewDiskCache
+
+
+class TestPreviewDiskCache:
+    """Test store/load round trip and invalidation."""
+
+    def _image(self):
+        image = QImage(40, 30, QImage.Format.Format_RGB32)
+        image.fill(QColor("red"))
+        return image
+
+    def test_stored_preview_is_loaded_back(self, tmp_path):
+        """A stored preview is returned for the same file and decode size only."""
+        source = tmp_path / "photo.jpg"
+        source.write_bytes(b"not really a jpeg")
+        cache = PreviewDiskCache(tmp_path / "cache")
+
+        cache.store(str(source), QSize(40, 30), self._image())
+
+        loaded = cache.load(str(source), QSize(40, 30))
+        assert loaded is not None and loaded.size() == QSize(40, 30)
+        assert cache.load(str(source), QSize(80, 60)) is None
+
+    def test_modified_file_misses(self, tmp_path):
+        """Changing the file (mtime/size) invalidates its cached preview."""
+        source = tmp_path / "photo.jpg"
+        source.write_bytes(b"v1")
+        cache = PreviewDiskCache(tmp_path / "cache")
+        cache.store(str(source), QSize(40, 30), self._image())
+
+        source.write_bytes(b"version two")
+        os.utime(source, ns=(1, 1))
+
+        assert cache.load(str(source), QSize(40, 30)) is None
+
+    def test_clear_removes_all_entries(self, tmp_path):
+        """clear() empties the cache directory; a missing directory is not an error."""
+        source = tmp_path / "photo.jpg"
+        source.write_bytes(b"not really a jpeg")
+        cache = PreviewDiskCache(tmp_path / "cache")
+        cache.store(str(source), QSize(40, 30), self._image())
+
+        cache.clear()
+
+        assert cache.load(str(source), QSize(40, 30)) is None
+        assert list((tmp_path / "cache").iterdir()) == []
+        PreviewDiskCache(tmp_path / "missing").clear()
@@ -437,6 +437,27 @@ class TestFileScannerImpl:
         files = scanner.scan(stopped_flag=lambda: False)
         assert len(files) == 2
 
+    def test_overlapping_root_directories_scan_each_file_once(self, temp_dir):
+        """A file reachable from two roots (parent and nested child) is returned once."""
+        subdir = temp_dir / "sub"
+        subdir.mkdir()
+        (temp_dir / "top.txt").write_bytes(b"top")
+        (subdir / "nested.txt").write_bytes(b"nested")
+
+        params = DeduplicationParams(
+            root_dirs=[str(temp_dir)],
+            min_size_bytes=0,
+            max_size_bytes=1024 * 1024,
+            extensions=[".txt"],
+            favourite_dirs=[],
+            excluded_dirs=[]
+        )
+        scanner = FileScanner(params=params)
+        scanner.root_dirs = [str(temp_dir), str(subdir)]
+        files = scanner.scan(stopped_flag=lambda: False)
+
+        assert sorted(Path(f.path).name for f in files) == ["nested.txt", "top.txt"]
+
 
 # =============================================================================
 # 4. SYSTEM TRASH DIRECTORY TESTS
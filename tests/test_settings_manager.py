@@ -0,0 +1,42 @@
+"""
+Unit tests for SettingsManager — cached, write-behind access to QSettings.
+"""
+
+from unittest.mock import Mock, patch
+import pytest
+from onlyone.gui.main_window import SettingsManager
+
+
+class TestSettingsManager:
+    """Test read caching and change-only write-back."""
+
+    @pytest.fixture
+    def backend(self):
+        """Mock QSettings backend shared by the manager under test."""
+        settings = Mock()
+        settings.value.side_effect = lambda key, default=None, **kwargs: {"min_size": 7}.get(key, default)
+        with patch("onlyone.gui.main_window._shared_settings", return_value=settings):
+            yield settings
+
+    def test_backend_is_read_once_per_key(self, backend):
+        """Repeated loads of the same key are served from the in-memory cache."""
+        manager = SettingsManager()
+
+        assert manager.load_settings("min_size", 100) == 7
+        assert manager.load_settings("min_size", 100) == 7
+        assert manager.load_many({"min_size": 100}) == {"min_size": 7}
+        assert backend.value.call_count == 1
+
+    def test_only_changed_values_are_written(self, backend):
+        """Values equal to the cached backend value are not handed to the writer."""
+        manager = SettingsManager()
+        manager.load_settings("min_size", 100)
+
+        with patch("onlyone.gui.main_window.SettingsWriter") as writer_cls:
+            manager._write_pool = Mock()
+            manager.save_many({"min_size": 7, "max_size": 50})
+            manager.save_many({"min_size": 7, "max_size": 50})
+
+        writer_cls.assert_called_once()
+        assert writer_cls.call_args[0][0] == {"max_size": 50}
+        assert manager.load_settings("max_size") == 50
@@ -0,0 +1,32 @@
+"""
+Unit tests for SettingsWriter — background QSettings commit runnable.
+"""
+
+from unittest.mock import patch
+from onlyone.gui.settings_writer import SettingsWriter
+
+
+class TestSettingsWriter:
+    """Test that a batch of values is written with a single sync()."""
+
+    def test_run_writes_all_values_and_syncs_once(self):
+        """Every value is passed to setValue, followed by exactly one sync()."""
+        writer = SettingsWriter({"min_size": 7, "extensions": ".jpg"}, "Org", "App")
+
+        with patch("onlyone.gui.settings_writer.QSettings") as settings_cls:
+            writer.run()
+
+        settings_cls.assert_called_once_with("Org", "App")
+        settings = settings_cls.return_value
+        settings.setValue.assert_any_call("min_size", 7)
+        settings.setValue.assert_any_call("extensions", ".jpg")
+        assert settings.setValue.call_count == 2
+        settings.sync.assert_called_once()
+
+    def test_run_does_not_raise_on_backend_error(self):
+        """Backend errors are logged, not propagated out of the pool thread."""
+        writer = SettingsWriter({"min_size": 7}, "Org", "App")
+
+        with patch("onlyone.gui.settings_writer.QSettings") as settings_cls:
+            settings_cls.return_value.sync.side_effect = RuntimeError("disk full")
+            writer.run()
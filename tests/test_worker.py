@@ -75,6 +75,26 @@ class TestDeduplicateWorker:
         worker.safe_progress_emit("hashing", 20, 100)
         assert progress_handler.call_count == 1  # Still 1, not 2
 
+    def test_safe_progress_emit_is_throttled_within_stage(self, valid_params):
+        """
+        A burst of updates within one stage is coalesced, but stage changes
+        and the final (current == total) update are always emitted.
+        """
+        worker = DeduplicateWorker(valid_params)
+        progress_handler = Mock()
+        worker.signals.progress.connect(progress_handler)
+
+        for i in range(1, 100):
+            worker.safe_progress_emit("hashing", i, 100)
+        worker.safe_progress_emit("hashing", 100, 100)
+        worker.safe_progress_emit("Full Hash", 1, 10)
+
+        emitted = [c[0] for c in progress_handler.call_args_list]
+        assert len(emitted) < 100
+        assert emitted[0] == ("hashing", 1, 100)
+        assert ("hashing", 100, 100) in emitted
+        assert emitted[-1] == ("Full Hash", 1, 10)
+
     def test_run_emits_finished_on_success(self, valid_params):
         """
         Successful execution must emit finished signal with groups/stats.